@@ -14,6 +14,8 @@ class FrameGrabber:
         self.buffer = deque(maxlen=maxlen)
         self.running = False
         self.lock = threading.Lock()
+        self.new_frame = threading.Condition(self.lock)  # notified on every appended frame
+        self.frame_count = 0
         self.thread = threading.Thread(target=self._grab_loop, daemon=True)
 
     def start(self):
@@ -26,6 +28,8 @@ class FrameGrabber:
             if frame is not None:
                 with self.lock:
                     self.buffer.append(frame)
+                    self.frame_count += 1
+                    self.new_frame.notify_all()
             else:
                 time.sleep(0.001)  # avoid busy loop if capture fails
 
@@ -35,6 +39,15 @@ class FrameGrabber:
                 return self.buffer[-1]
         return None
 
+    def wait_for_frame(self, last_count, timeout=None):
+        """
+        Block until a frame newer than last_count has been grabbed.
+        Returns the current frame_count (unchanged from last_count on timeout).
+        """
+        with self.lock:
+            self.new_frame.wait_for(lambda: self.frame_count != last_count, timeout)
+            return self.frame_count
+
     def stop(self):
         self.running = False
         self.thread.join()
\ No newline at end of file
@@ -8,6 +8,7 @@ class IService(ABC):
     Allows VisionSystem to use local or remote storage interchangeably.
     Also abstracts camera calibration and work area data.
     """
+    __slots__ = ()   # no state of its own; lets slotted implementations skip __dict__
 
     # ---------------- Settings methods ----------------
     @abstractmethod
@@ -15,6 +15,19 @@ class Settings:
         if key in self._settings:
             del self._settings[key]
 
+    def copy(self):
+        """
+        Return an independent copy of these settings.
+
+        Values are scalars, strings or short [x, y] lists, so copying the
+        dict and each list one level deep is enough — far cheaper than
+        copy.deepcopy's generic recursive walk.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._settings = {k: (v.copy() if type(v) is list else v) for k, v in self._settings.items()}
+        return clone
+
     def get_all_settings(self):
         """Returns all the settings as a dictionary."""
         return self._settings
@@ -3,6 +3,11 @@ import os
 import tempfile
 from typing import Callable
 
+try:
+    import orjson
+except ImportError:  # optional — fall back to the stdlib codec
+    orjson = None
+
 from src.VisionSystem.core.settings.CameraSettingKey import CameraSettingKey
 from src.VisionSystem.core.logging.custom_logging import log_if_enabled, LoggingLevel
 
@@ -19,6 +24,9 @@ class SettingsManager:
             # If file doesn't exist → return empty dict
             return {}
         print(f"[SettingsManager] Loading settings from {self.config_file_path}")
+        if orjson is not None:
+            with open(self.config_file_path, "rb") as f:
+                return orjson.loads(f.read())
         with open(self.config_file_path) as f:
             return json.load(f)
 
@@ -29,8 +37,12 @@ class SettingsManager:
         # This prevents a crash mid-write from corrupting the JSON file.
         fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(settings, f, indent=2)
+            if orjson is not None:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+            else:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(settings, f, indent=2)
             os.replace(tmp_path, self.config_file_path)
         except Exception:
             os.unlink(tmp_path)
@@ -62,8 +62,9 @@ class BrightnessManager:
 
         area = np.array([area_p1, area_p2, area_p3, area_p4], dtype=np.float32)
 
-        # Apply current cumulative adjustment first
-        adjusted_frame = self.brightnessController.adjustBrightness(self.vision_system.image, self.brightnessAdjustment)
+        # Apply current cumulative adjustment first (scratch buffer, only measured)
+        adjusted_frame = self.brightnessController.adjustBrightness(self.vision_system.image, self.brightnessAdjustment,
+                                                                    reuse_buffer=True)
 
         # Measure brightness of the adjusted frame (feedback loop)
         current_brightness = self.brightnessController.calculateBrightness(adjusted_frame, area)
@@ -89,7 +90,7 @@ class BrightnessManager:
         # Clamp total adjustment to valid range
         self.brightnessAdjustment = np.clip(self.brightnessAdjustment, -255, 255)
 
-        # Apply the updated cumulative adjustment
+        # Apply the updated cumulative adjustment; this frame is published, so it gets its own buffer
         final_frame = self.brightnessController.adjustBrightness(self.vision_system.image, self.brightnessAdjustment)
 
         # Measure final result for logging
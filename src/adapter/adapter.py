@@ -48,7 +48,7 @@ if __name__ == "__main__":
     plugin.load()
 
     # ── Frame bridge: vision thread → Qt main thread → preview label ─────────
-    bridge = FrameBridge(preview_label=plugin.preview_label)
+    bridge = FrameBridge(get_preview_label=lambda: plugin.preview_label)
     broker.subscribe(VisionTopics.LATEST_IMAGE,    bridge.on_live_frame)
     broker.subscribe(VisionTopics.THRESHOLD_IMAGE, bridge.on_threshold_frame)
     plugin.widget.controls.view_mode_changed.connect(bridge.set_mode)
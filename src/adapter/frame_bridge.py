@@ -12,14 +12,16 @@ import threading
 import cv2
 import numpy as np
 from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage
 
 
 class FrameBridge:
     """Thread-safe bridge between vision worker frames and a Qt preview label."""
 
-    def __init__(self, preview_label, fps: int = 60):
-        self._label = preview_label
+    def __init__(self, get_preview_label, fps: int = 60):
+        # Looked up on every tick: the view may replace (and delete) its
+        # preview label via set_preview_widget(), after which this returns None.
+        self._get_label = get_preview_label
         self._live_slot: np.ndarray | None = None
         self._thresh_slot: np.ndarray | None = None
         self._mode: str = "live"
@@ -64,10 +66,15 @@ class FrameBridge:
             else:
                 frame, self._live_slot = self._live_slot, None
 
-        if frame is None or self._label is None:
+        if frame is None:
+            return
+        label = self._get_label()
+        if label is None:
             return
 
-        h, w, ch = frame.shape
-        qt_image = QImage(frame.tobytes(), w, h, ch * w, QImage.Format.Format_BGR888)
-        self._label.set_frame(QPixmap.fromImage(qt_image))
+        # Wrap the ndarray buffer directly (no tobytes() copy, no BGR→RGB pass);
+        # set_frame_image copies it into the label's pixmap before `frame` goes away.
+        h, w, _ = frame.shape
+        qt_image = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+        label.set_frame_image(qt_image)
 
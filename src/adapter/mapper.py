@@ -7,19 +7,42 @@ Direction: adapter → plugin DTO, adapter → vision model.
 """
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import List, Tuple, cast
+from dataclasses import replace
 
 from src.VisionSystem.core.settings.CameraSettings import CameraSettings
 from src.plugin.camera_settings.camera_settings_data import CameraSettingsData
 
 
+# Flat-dict key → coercion applied when merging a value into the DTO.
+# The single source for both from_flat_dict and apply_delta.
+_FLAT_COERCE = {
+    "index": int, "width": int, "height": int, "skip_frames": int,
+    "contour_detection": bool, "draw_contours": bool,
+    "threshold": int, "threshold_pickup_area": int, "epsilon": float,
+    "min_contour_area": float, "max_contour_area": float,
+    "gaussian_blur": bool, "blur_kernel_size": int, "threshold_type": str,
+    "dilate_enabled": bool, "dilate_kernel_size": int, "dilate_iterations": int,
+    "erode_enabled": bool, "erode_kernel_size": int, "erode_iterations": int,
+    "chessboard_width": int, "chessboard_height": int,
+    "square_size_mm": float, "calibration_skip_frames": int,
+    "brightness_auto": bool, "brightness_kp": float, "brightness_ki": float,
+    "brightness_kd": float, "target_brightness": float,
+    "aruco_enabled": bool, "aruco_dictionary": str, "aruco_flip_image": bool,
+}
+
+
+def _coerce_flat(flat: dict) -> dict:
+    """Known flat keys of *flat*, each coerced to its DTO field type; others are ignored."""
+    return {k: _FLAT_COERCE[k](v) for k, v in flat.items() if k in _FLAT_COERCE}
+
+
 class VisionSystemSettingsMapper:
     """
     Implements ISettingsMapper.
 
     to_flat_dict  : CameraSettings (vision)  → flat dict  (view)
     from_flat_dict: flat dict (view) + base  → CameraSettingsData (plugin DTO)
+    apply_delta   : changed keys + base      → CameraSettingsData (plugin DTO)
 
     Also provides:
     to_domain     : CameraSettingsData       → CameraSettings (vision)
@@ -67,57 +90,19 @@ class VisionSystemSettingsMapper:
 
     def from_flat_dict(self, flat: dict, base: CameraSettingsData) -> CameraSettingsData:
         """Merge a flat dict from SettingsView into a copy of the base DTO."""
-        d = deepcopy(base)
-        g = flat.get
-
-        d.index                   = int(g("index",                   d.index))
-        d.width                   = int(g("width",                   d.width))
-        d.height                  = int(g("height",                  d.height))
-        d.skip_frames             = int(g("skip_frames",             d.skip_frames))
-
-        d.contour_detection       = bool(g("contour_detection",      d.contour_detection))
-        d.draw_contours           = bool(g("draw_contours",          d.draw_contours))
-        d.threshold               = int(g("threshold",               d.threshold))
-        d.threshold_pickup_area   = int(g("threshold_pickup_area",   d.threshold_pickup_area))
-        d.epsilon                 = float(g("epsilon",               d.epsilon))
-        d.min_contour_area        = float(g("min_contour_area",      d.min_contour_area))
-        d.max_contour_area        = float(g("max_contour_area",      d.max_contour_area))
-
-        d.gaussian_blur           = bool(g("gaussian_blur",          d.gaussian_blur))
-        d.blur_kernel_size        = int(g("blur_kernel_size",        d.blur_kernel_size))
-        d.threshold_type          = str(g("threshold_type",          d.threshold_type))
-        d.dilate_enabled          = bool(g("dilate_enabled",         d.dilate_enabled))
-        d.dilate_kernel_size      = int(g("dilate_kernel_size",      d.dilate_kernel_size))
-        d.dilate_iterations       = int(g("dilate_iterations",       d.dilate_iterations))
-        d.erode_enabled           = bool(g("erode_enabled",          d.erode_enabled))
-        d.erode_kernel_size       = int(g("erode_kernel_size",       d.erode_kernel_size))
-        d.erode_iterations        = int(g("erode_iterations",        d.erode_iterations))
-
-        d.chessboard_width        = int(g("chessboard_width",        d.chessboard_width))
-        d.chessboard_height       = int(g("chessboard_height",       d.chessboard_height))
-        d.square_size_mm          = float(g("square_size_mm",        d.square_size_mm))
-        d.calibration_skip_frames = int(g("calibration_skip_frames", d.calibration_skip_frames))
-
-        d.brightness_auto         = bool(g("brightness_auto",        d.brightness_auto))
-        d.brightness_kp           = float(g("brightness_kp",         d.brightness_kp))
-        d.brightness_ki           = float(g("brightness_ki",         d.brightness_ki))
-        d.brightness_kd           = float(g("brightness_kd",         d.brightness_kd))
-        d.target_brightness       = float(g("target_brightness",     d.target_brightness))
-
-        d.aruco_enabled           = bool(g("aruco_enabled",          d.aruco_enabled))
-        d.aruco_dictionary        = str(g("aruco_dictionary",        d.aruco_dictionary))
-        d.aruco_flip_image        = bool(g("aruco_flip_image",       d.aruco_flip_image))
-
-        return d
+        return replace(base, **_coerce_flat(flat))
+
+    def apply_delta(self, delta: dict, base: CameraSettingsData) -> CameraSettingsData:
+        """Merge only the changed flat keys into a copy of the base DTO."""
+        return replace(base, **_coerce_flat(delta))
 
     # ── Cross-layer translation ──────────────────────────────────────────────
 
     def to_dto(self, domain: CameraSettings) -> CameraSettingsData:
         """CameraSettings (vision domain) → CameraSettingsData (plugin DTO)."""
         raw_points = domain.get_brightness_area_points() or []
-        brightness_area_points = cast(
-            List[Tuple[int, int]],
-            [(int(pt[0]), int(pt[1])) for pt in raw_points if pt is not None],
+        brightness_area_points = tuple(
+            int(c) for pt in raw_points if pt is not None for c in pt[:2]
         )
 
         return CameraSettingsData(
@@ -172,8 +157,9 @@ class VisionSystemSettingsMapper:
             "Kd":                 dto.brightness_kd,
             "Target brightness":  dto.target_brightness,
         }
-        for i, pt in enumerate(dto.brightness_area_points[:4], start=1):
-            brightness[f"Brightness area point {i}"] = list(pt)
+        pts = dto.brightness_area_points
+        for n, i in enumerate(range(0, min(len(pts) - 1, 8), 2), start=1):
+            brightness[f"Brightness area point {n}"] = [pts[i], pts[i + 1]]
 
         return {
             "Index":                   dto.index,
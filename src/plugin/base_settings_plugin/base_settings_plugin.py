@@ -1,3 +1,5 @@
+import logging
+from functools import cached_property
 from typing import Generic, TypeVar, Optional, Tuple
 from PyQt6.QtWidgets import QWidget
 
@@ -7,6 +9,12 @@ TModel = TypeVar("TModel")
 TController = TypeVar("TController")
 TView = TypeVar("TView", bound=QWidget)
 
+logger = logging.getLogger(__name__)
+
+
+def _noop() -> None:
+    pass
+
 
 class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
     """
@@ -15,6 +23,9 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
     Handles wiring of service → model → controller → view,
     exposes widget, load(), save() consistently.
 
+    Model, view and controller are built lazily on first access, so plugins
+    whose tab is never opened don't pay for QWidget construction.
+
     Usage:
         class MyPlugin(BaseSettingsPlugin[MyService, MyModel, MyController, QWidget]):
             def _create_model(self, service: MyService) -> MyModel:
@@ -35,10 +46,31 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
             service: The service that handles data persistence
         """
         self._service = service
-        self._model: TModel = self._create_model(service)
-        self._view: TView = self._create_view()
-        self._controller: TController = self._create_controller(self._model, self._view)
-        self._widget: QWidget = self._extract_main_widget(self._view)
+        self._save = _noop   # replaced once the controller exists
+
+    # ── Lazily built MVC parts ───────────────────────────────────────────────────
+
+    @cached_property
+    def _model(self) -> TModel:
+        return self._create_model(self._service)
+
+    @cached_property
+    def _view(self) -> TView:
+        return self._create_view()
+
+    @cached_property
+    def _controller(self) -> TController:
+        controller = self._create_controller(self._model, self._view)
+        # Resolve the optional load/save hooks once instead of hasattr() per call
+        self._load = getattr(controller, "load", _noop)
+        self._save = getattr(controller, "save", self._report_missing_save)
+        return controller
+
+    @cached_property
+    def _widget(self) -> QWidget:
+        # Touch the controller so the view is wired before it is shown
+        self._controller
+        return self._extract_main_widget(self._view)
 
     # ── Abstract Methods ─────────────────────────────────────────────────────────
 
@@ -59,6 +91,9 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
             return view_result[0]
         return view_result
 
+    def _report_missing_save(self) -> None:
+        logger.debug("[%s] Save not implemented; may auto-save on change", self.__class__.__name__)
+
     # ── Public API ───────────────────────────────────────────────────────────────
 
     @property
@@ -68,12 +103,9 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
 
     def load(self) -> None:
         """Load data from model/service into the UI via controller."""
-        if hasattr(self._controller, "load"):
-            self._controller.load()
+        self.widget   # materialise model → view → controller
+        self._load()
 
     def save(self) -> None:
         """Save current settings via controller/model to service."""
-        if hasattr(self._controller, "save"):
-            self._controller.save()
-        else:
-            print(f"[{self.__class__.__name__}] Save not implemented; may auto-save on change")
\ No newline at end of file
+        self._save()   # no-op until the view has been built
\ No newline at end of file
@@ -17,4 +17,5 @@ class ISettingsMapper(Protocol):
 
     def to_flat_dict(self, settings: CameraSettingsData) -> dict: ...
     def from_flat_dict(self, flat: dict, base: CameraSettingsData) -> CameraSettingsData: ...
+    def apply_delta(self, delta: dict, base: CameraSettingsData) -> CameraSettingsData: ...
 
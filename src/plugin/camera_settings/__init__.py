@@ -5,7 +5,11 @@ from src.plugin.utils_widgets.clickable_label import ClickableLabel
 
 from src.plugin.camera_settings.controller import CameraSettingsController
 from src.plugin.camera_settings.model import CameraSettingsModel
-from src.plugin.camera_settings.ICameraSettingsService import ISettingsPersistenceService, ICameraActionsService
+from src.plugin.camera_settings.ICameraSettingsService import (
+    ISettingsPersistenceService,
+    ICameraActionsService,
+    ICameraSettingsService,  # legacy combined protocol, re-exported for back-compat
+)
 from src.plugin.camera_settings.ISettingsMapper import ISettingsMapper
 from src.plugin.camera_settings.view.camera_tab import camera_tab_factory
 from src.plugin.camera_settings.view.camera_settings_view import CameraSettingsView
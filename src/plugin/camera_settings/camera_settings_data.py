@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass
@@ -45,8 +45,9 @@ class CameraSettingsData:
     brightness_ki:            float = 0.2
     brightness_kd:            float = 0.05
     target_brightness:        float = 200.0
-    # Brightness area points are set via camera preview — not a schema widget
-    brightness_area_points: List[Tuple[int, int]] = field(default_factory=list)
+    # Brightness area points are set via camera preview — not a schema widget.
+    # Stored flat: (x1, y1, x2, y2, ...) for up to four corners.
+    brightness_area_points:   Tuple[int, ...] = ()
 
     # ArUco
     aruco_enabled:            bool  = False
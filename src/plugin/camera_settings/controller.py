@@ -1,8 +1,12 @@
+import logging
+
 from src.plugin.camera_settings.model import CameraSettingsModel
 from src.plugin.camera_settings.ISettingsMapper import ISettingsMapper
 from src.plugin.camera_settings.view.camera_settings_view import CameraSettingsView
 
-_TOGGLE_KEYS = {
+logger = logging.getLogger(__name__)
+
+_TOGGLE_KEYS = frozenset({
     "contour_detection",
     "draw_contours",
     "gaussian_blur",
@@ -11,7 +15,7 @@ _TOGGLE_KEYS = {
     "brightness_auto",
     "aruco_enabled",
     "aruco_flip_image",
-}
+})
 
 
 class CameraSettingsController:
@@ -19,20 +23,34 @@ class CameraSettingsController:
         self._model = model
         self._view = view
         self._mapper = mapper
+        self._loading = False
+        self._last_flat: dict = {}   # flat snapshot last loaded / saved
 
         self._view.save_requested.connect(self._on_save)
         self._view.value_changed_signal.connect(self._on_value_changed)
 
     def load(self) -> None:
-        settings = self._model.load()
-        self._view.settings_view.set_values(self._mapper.to_flat_dict(settings))
+        self._loading = True
+        try:
+            settings = self._model.load()
+            self._last_flat = self._mapper.to_flat_dict(settings)
+            self._view.settings_view.set_values(self._last_flat)
+        finally:
+            self._loading = False
 
     def _on_value_changed(self, key: str, value, component_name: str) -> None:
-        if key in _TOGGLE_KEYS:
-            self._on_save(self._view.settings_view.get_values())
+        if self._loading or key not in _TOGGLE_KEYS:
+            return
+        if self._last_flat.get(key) == value:
+            return   # toggle reflects the stored state, nothing to save
+        # Only this key changed — merge it instead of rebuilding from every widget
+        settings = self._mapper.apply_delta({key: value}, self._model._settings)
+        self._model.save(settings)
+        self._last_flat[key] = value
 
     def _on_save(self, flat: dict) -> None:
         current_settings = self._model._settings
         settings = self._mapper.from_flat_dict(flat, current_settings)
         self._model.save(settings)
-        print(f"[controller] Camera settings saved successfully")
+        self._last_flat = flat
+        logger.debug("Camera settings saved successfully")
@@ -10,27 +10,45 @@ src/adapter/mapper.py (VisionSystemSettingsMapper).
 """
 from __future__ import annotations
 
-from typing import List, Tuple
+from types import MappingProxyType
 
 from src.plugin.camera_settings.camera_settings_data import CameraSettingsData
 
 
+# Shared read-only stand-in for a missing section, so from_json does not
+# allocate a fresh {} per absent group on every call.
+_EMPTY = MappingProxyType({})
+
+# Section keys of the nested camera_settings.json format
+_K_PREPROCESSING = "Preprocessing"
+_K_CALIBRATION   = "Calibration"
+_K_BRIGHTNESS    = "Brightness Control"
+_K_ARUCO         = "Aruco"
+
+# The schema has exactly four brightness-area corners
+_BP1 = "Brightness area point 1"
+_BP2 = "Brightness area point 2"
+_BP3 = "Brightness area point 3"
+_BP4 = "Brightness area point 4"
+_BP_KEYS = (_BP1, _BP2, _BP3, _BP4)
+
+
 class CameraSettingsMapper:
     """JSON ↔ CameraSettingsData — plugin-internal use only."""
 
     @staticmethod
     def from_json(data: dict) -> CameraSettingsData:
         """Parse from the nested JSON format used by the repository."""
-        pre   = data.get("Preprocessing",      {})
-        cal   = data.get("Calibration",        {})
-        bri   = data.get("Brightness Control", {})
-        aruco = data.get("Aruco",              {})
+        pre   = data.get(_K_PREPROCESSING, _EMPTY)
+        cal   = data.get(_K_CALIBRATION,   _EMPTY)
+        bri   = data.get(_K_BRIGHTNESS,    _EMPTY)
+        aruco = data.get(_K_ARUCO,         _EMPTY)
 
-        points: List[Tuple[int, int]] = []
-        for i in range(1, 5):
-            pt = bri.get(f"Brightness area point {i}")
-            if pt:
-                points.append((int(pt[0]), int(pt[1])))
+        p1 = bri.get(_BP1)
+        p2 = bri.get(_BP2)
+        p3 = bri.get(_BP3)
+        p4 = bri.get(_BP4)
+        points = tuple(int(c) for pt in (p1, p2, p3, p4) if pt for c in pt[:2])
 
         return CameraSettingsData(
             index                   = data.get("Index",                    0),
@@ -72,16 +90,7 @@ class CameraSettingsMapper:
     @staticmethod
     def to_json(data: CameraSettingsData) -> dict:
         """Serialize to the nested JSON format used by the repository."""
-        bri: dict = {
-            "Enable auto adjust": data.brightness_auto,
-            "Kp":                 data.brightness_kp,
-            "Ki":                 data.brightness_ki,
-            "Kd":                 data.brightness_kd,
-            "Target brightness":  data.target_brightness,
-        }
-        for i, pt in enumerate(data.brightness_area_points[:4], start=1):
-            bri[f"Brightness area point {i}"] = list(pt)
-
+        pts = data.brightness_area_points
         return {
             "Index":                   data.index,
             "Width":                   data.width,
@@ -95,7 +104,7 @@ class CameraSettingsMapper:
             "Epsilon":                 data.epsilon,
             "Min contour area":        data.min_contour_area,
             "Max contour area":        data.max_contour_area,
-            "Preprocessing": {
+            _K_PREPROCESSING: {
                 "Gaussian blur":      data.gaussian_blur,
                 "Blur kernel size":   data.blur_kernel_size,
                 "Threshold type":     data.threshold_type,
@@ -106,14 +115,22 @@ class CameraSettingsMapper:
                 "Erode kernel size":  data.erode_kernel_size,
                 "Erode iterations":   data.erode_iterations,
             },
-            "Calibration": {
+            _K_CALIBRATION: {
                 "Chessboard width":  data.chessboard_width,
                 "Chessboard height": data.chessboard_height,
                 "Square size (mm)":  data.square_size_mm,
                 "Skip frames":       data.calibration_skip_frames,
             },
-            "Brightness Control": bri,
-            "Aruco": {
+            _K_BRIGHTNESS: {
+                "Enable auto adjust": data.brightness_auto,
+                "Kp":                 data.brightness_kp,
+                "Ki":                 data.brightness_ki,
+                "Kd":                 data.brightness_kd,
+                "Target brightness":  data.target_brightness,
+                **{bp_key: [pts[i], pts[i + 1]]
+                   for bp_key, i in zip(_BP_KEYS, range(0, len(pts) - 1, 2))},
+            },
+            _K_ARUCO: {
                 "Enable detection": data.aruco_enabled,
                 "Dictionary":       data.aruco_dictionary,
                 "Flip image":       data.aruco_flip_image,
@@ -14,5 +14,7 @@ class CameraSettingsModel:
         return self._settings
 
     def save(self, settings: CameraSettingsData) -> None:
+        if settings == self._settings:
+            return   # nothing changed — skip the serialize + disk write
         self._service.save_settings(settings)
         self._settings = settings
@@ -134,9 +134,16 @@ class CameraSettingsView(QWidget):
 
     def set_preview_widget(self, widget: QWidget) -> None:
         """Replace the ClickableLabel with a real camera feed widget."""
-        self._preview_label.setParent(None)
-        self._preview_label = None
-        self._left_layout.insertWidget(0, widget, stretch=1)
+        panel = self._left_layout.parentWidget()
+        panel.setUpdatesEnabled(False)   # one repaint for the whole swap
+        try:
+            if self._preview_label is not None:
+                self._left_layout.removeWidget(self._preview_label)
+                self._preview_label.deleteLater()
+                self._preview_label = None
+            self._left_layout.insertWidget(0, widget, stretch=1)
+        finally:
+            panel.setUpdatesEnabled(True)
 
     @property
     def preview_label(self) -> ClickableLabel | None:
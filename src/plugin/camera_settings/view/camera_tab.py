@@ -15,6 +15,9 @@ from src.plugin.camera_settings.view.camera_settings_schema import (
 )
 
 
+_POINTING = Qt.CursorShape.PointingHandCursor
+
+
 def camera_tab_factory(mapper: Callable, parent=None) -> Tuple[CameraSettingsView, SettingsView]:
     settings_view = SettingsView(
         component_name="CameraSettings",
@@ -28,7 +31,7 @@ def camera_tab_factory(mapper: Callable, parent=None) -> Tuple[CameraSettingsVie
     # Brightness tab — schema fields + "Set on Preview" toggle button
     brightness_btn = QPushButton("Set Brightness Area on Preview")
     brightness_btn.setCheckable(True)
-    brightness_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    brightness_btn.setCursor(_POINTING)
     # brightness_btn.setStyleSheet(_SET_AREA_BTN_STYLE)
     settings_view.add_tab("Brightness", [BRIGHTNESS_GROUP], footer=brightness_btn)
 
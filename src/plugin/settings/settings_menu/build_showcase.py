@@ -5,37 +5,50 @@ from src.settings.settings_menu.category_descriptor import CategoryDescriptor
 from src.settings.settings_menu.settings_menu import SettingsNavigationWidget
 from src.settings.settings_view.build_showcase import build_showcase
 
-def build_settings_menu_showcase():
-    CUSTOM_CATEGORIES = [
-        CategoryDescriptor(
-            id = "robot",
-            icon = "mdi.robot-industrial"
-        ),
-        CategoryDescriptor(
-            id = "glue",
-            icon = "fa6s.droplet"
-        ),
-        CategoryDescriptor(
-            id = "camera",
-            icon = "mdi.camera"
-        ),
-    ]
-
-    # Define factory map - functions that create widgets for each category
-    factory_map = {
-        "robot":  lambda: robot_tab_factory()[0],
-        "glue":   lambda: glue_tab_factory()[0],
-        "camera": lambda: camera_tab_factory()[0],
-        "users": build_showcase,
-        "database": build_showcase,
-        "api": build_showcase,
-        "backup": build_showcase,
-        "logging": build_showcase,
-    }
 
+def _main_widget(tab_factory):
+    """Adapt a tab factory returning (widget, ...) to a plain widget factory."""
+    def factory():
+        return tab_factory()[0]
+    return factory
+
+
+# Built once at import. The factories themselves still build a fresh widget
+# per navigation widget: SettingsNavigationWidget calls each one exactly once
+# and takes ownership of the result, so a widget cannot be shared between
+# navigation instances (or between the categories that reuse build_showcase).
+_CUSTOM_CATEGORIES = (
+    CategoryDescriptor(
+        id = "robot",
+        icon = "mdi.robot-industrial"
+    ),
+    CategoryDescriptor(
+        id = "glue",
+        icon = "fa6s.droplet"
+    ),
+    CategoryDescriptor(
+        id = "camera",
+        icon = "mdi.camera"
+    ),
+)
+
+# Define factory map - functions that create widgets for each category
+_FACTORY_MAP = {
+    "robot":  _main_widget(robot_tab_factory),
+    "glue":   _main_widget(glue_tab_factory),
+    "camera": _main_widget(camera_tab_factory),
+    "users": build_showcase,
+    "database": build_showcase,
+    "api": build_showcase,
+    "backup": build_showcase,
+    "logging": build_showcase,
+}
+
+
+def build_settings_menu_showcase():
     nav = SettingsNavigationWidget(
-            categories=CUSTOM_CATEGORIES,
-            factory_map=factory_map
+            categories=list(_CUSTOM_CATEGORIES),
+            factory_map=_FACTORY_MAP
         )
 
-    return nav
\ No newline at end of file
+    return nav
@@ -6,6 +6,8 @@ from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
 
 
 _icon_cache = {}
+# QIcon.cacheKey() -> qtawesome source string the icon was rendered from
+_icon_origin = {}
 
 
 def _tint_icon(icon, color, size):
@@ -38,7 +40,8 @@ def load_icon(source, color=None, size=None):
     """Single source of truth for icon loading.
 
     Args:
-        source: QIcon object, file path string, or qtawesome string (e.g. "fa5s.cog")
+        source: QIcon object, file path string, freedesktop theme name
+                (e.g. "document-save") or qtawesome string (e.g. "fa5s.cog")
         color:  Optional color string for tinting (e.g. "#FFFFFF")
         size:   Optional QSize — required when tinting a QIcon object
 
@@ -47,6 +50,11 @@ def load_icon(source, color=None, size=None):
     """
     if isinstance(source, QIcon):
         if color and size:
+            # Icons we rendered from qtawesome can be re-rendered at the target
+            # color directly; only unknown icons need the QPainter composite.
+            origin = _icon_origin.get(source.cacheKey())
+            if origin is not None:
+                return load_icon(origin, color=color, size=size)
             return _tint_icon(source, color, size)
         return source
 
@@ -65,6 +73,11 @@ def load_icon(source, color=None, size=None):
         icon = QIcon(source)
         if icon.isNull():
             icon = None
+    elif QIcon.hasThemeIcon(source):
+        # System icon theme — served from the theme cache, no glyph rendering
+        icon = QIcon.fromTheme(source)
+        if color and size:
+            icon = _tint_icon(icon, color, size)
     else:
         # Try qtawesome icon string
         try:
@@ -74,6 +87,8 @@ def load_icon(source, color=None, size=None):
                 icon = qta.icon(source)
             if icon.isNull():
                 icon = None
+            else:
+                _icon_origin[icon.cacheKey()] = source
         except Exception:
             icon = None
 
@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (QPushButton, QGraphicsDropShadowEffect)
@@ -13,6 +16,82 @@ from src.settings.settings_view.styles import (
 from src.settings.settings_menu.icon_loader import load_icon
 
 
+# ── stylesheets (formatted once at import, shared by every MenuIcon) ─────────
+
+def _button_style(background, hover, pressed, text_color, radius=28):
+    return f"""
+            QPushButton {{
+                background: {background};
+                color: {text_color};
+                border: none;
+                border-radius: {radius}px;
+                font-size: 12px;
+                font-weight: 500;
+                font-family: 'Roboto', 'Segoe UI', sans-serif;
+                text-align: center;
+                padding: 8px;
+            }}
+            QPushButton:hover {{
+                background: {hover};
+            }}
+            QPushButton:pressed {{
+                background: {pressed};
+            }}
+            QPushButton:disabled {{
+                background: {DISABLED_BG};
+                color: {SCROLLBAR_HANDLE_HOVER};
+            }}
+        """
+
+
+_VARIANT_COLORS = {
+    "primary":   (PRIMARY,      PRIMARY_HOVER,   PRIMARY_DARK,      TEXT_ON_PRIMARY),
+    "secondary": (SECONDARY_BG, SECONDARY_HOVER, SECONDARY_PRESSED, PRIMARY),
+    "tertiary":  (TERTIARY_BG,  TERTIARY_HOVER,  TERTIARY_PRESSED,  TERTIARY_TEXT),
+}
+
+_SIZE_VARIANTS = {
+    "compact":  QSize(80, 80),
+    "standard": QSize(112, 112),
+    "large":    QSize(144, 144),
+}
+
+# (variant, border radius) -> stylesheet; 20/28/36 are the compact/standard/large radii
+_MATERIAL_STYLES = {
+    (variant, radius): _button_style(*colors, radius=radius)
+    for variant, colors in _VARIANT_COLORS.items()
+    for radius in (20, 28, 36)
+}
+
+_PRIMARY_SS = _MATERIAL_STYLES[("primary", 28)]
+
+# Fallback-text font rule, keyed by font size
+_FALLBACK_TEXT_STYLES = {
+    font_size: f"""
+            QPushButton {{
+                font-size: {font_size}px;
+                font-weight: 500;
+                letter-spacing: 0.5px;
+            }}
+        """
+    for font_size in (14, 18)
+}
+
+_RADIUS_RE = re.compile(r'border-radius:\s*\d+px')
+
+_LEFT_BUTTON = Qt.MouseButton.LeftButton
+
+# Shadow colours for the normal / hover elevation (setColor copies them)
+_QC_SHADOW_PRIMARY = QColor(*SHADOW_PRIMARY)
+_QC_SHADOW_HOVER = QColor(*SHADOW_PRIMARY_HOVER)
+
+
+@lru_cache(maxsize=64)
+def _cached_icon(path, color, size_px):
+    """load_icon() memoized per (path, color, size) — QIcon is shareable."""
+    return load_icon(path, color=color, size=QSize(size_px, size_px))
+
+
 class MenuIcon(QPushButton):
     """Material Design 3 app icon with proper touch targets and visual feedback"""
 
@@ -27,6 +106,7 @@ class MenuIcon(QPushButton):
         # Optional color to use when rendering qtawesome icon strings specifically for mini icons
         self.qta_color = qta_color
         self._original_rect = None
+        self._ss_applied = False   # base stylesheet is applied on first show
 
         # Material Design touch target size (minimum 48dp)
         self.setFixedSize(112, 112)  # 112dp for comfortable touch interaction
@@ -40,40 +120,15 @@ class MenuIcon(QPushButton):
     def setup_ui(self):
         """Setup Material Design 3 styling with proper tokens"""
 
-        # Material Design 3 filled button styling
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {PRIMARY};
-                color: {TEXT_ON_PRIMARY};
-                border: none;
-                border-radius: 28px;
-                font-size: 12px;
-                font-weight: 500;
-                font-family: 'Roboto', 'Segoe UI', sans-serif;
-                text-align: center;
-                padding: 8px;
-            }}
-            QPushButton:hover {{
-                background: {PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background: {PRIMARY_DARK};
-            }}
-            QPushButton:disabled {{
-                background: {DISABLED_BG};
-                color: {SCROLLBAR_HANDLE_HOVER};
-            }}
-        """)
-
-        # Material Design elevation shadow (level 1)
-        try:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(12)
-            shadow.setColor(QColor(*SHADOW_PRIMARY))
-            shadow.setOffset(0, 2)
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        # Material Design 3 filled button styling is applied lazily by
+        # _ensure_style() so icons that are never shown skip the polish.
+
+        # Material Design elevation shadow (level 1). One effect per button,
+        # re-tuned on hover: setGraphicsEffect() deletes the effect it replaces,
+        # so swapping between two instances is not an option.
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._apply_shadow(12, _QC_SHADOW_PRIMARY, 2)
+        self.setGraphicsEffect(self._shadow)
 
         # Setup icon and text with Material Design principles
         self.setup_icon_content()
@@ -86,7 +141,10 @@ class MenuIcon(QPushButton):
         icon_size = int(self.width() * 0.5)
         size = QSize(icon_size, icon_size)
 
-        icon = load_icon(self.icon_path, color=self.qta_color, size=size)
+        if isinstance(self.icon_path, str):
+            icon = _cached_icon(self.icon_path, self.qta_color, icon_size)
+        else:
+            icon = load_icon(self.icon_path, color=self.qta_color, size=size)   # QIcon: not hashable
         if icon and not icon.isNull():
             self.setIcon(icon)
             self.setIconSize(size)
@@ -118,45 +176,41 @@ class MenuIcon(QPushButton):
             font_size = 14  # Smaller for longer text
 
         # Update stylesheet for text-only display
-        self.setStyleSheet(self.styleSheet() + f"""
-            QPushButton {{
-                font-size: {font_size}px;
-                font-weight: 500;
-                letter-spacing: 0.5px;
-            }}
-        """)
+        self._ensure_style()
+        self.setStyleSheet(self.styleSheet() + _FALLBACK_TEXT_STYLES[font_size])
+
+    def _ensure_style(self):
+        """Apply the base filled-button stylesheet if nothing has set one yet."""
+        if not self._ss_applied:
+            self._ss_applied = True
+            self.setStyleSheet(_PRIMARY_SS)
+
+    def showEvent(self, event):
+        self._ensure_style()
+        super().showEvent(event)
 
     def enterEvent(self, event):
         """Material Design hover state"""
         super().enterEvent(event)
 
         # Update shadow for hover state (Material Design elevation change)
-        try:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(16)
-            shadow.setColor(QColor(*SHADOW_PRIMARY_HOVER))
-            shadow.setOffset(0, 4)
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        self._apply_shadow(16, _QC_SHADOW_HOVER, 4)
 
     def leaveEvent(self, event):
         """Material Design normal state restoration"""
         super().leaveEvent(event)
 
         # Restore normal shadow
-        try:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(12)
-            shadow.setColor(QColor(*SHADOW_PRIMARY))
-            shadow.setOffset(0, 2)
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        self._apply_shadow(12, _QC_SHADOW_PRIMARY, 2)
+
+    def _apply_shadow(self, blur_radius, color, offset_y):
+        self._shadow.setBlurRadius(blur_radius)
+        self._shadow.setColor(color)
+        self._shadow.setOffset(0, offset_y)
 
     def mousePressEvent(self, event):
         """Material Design press interaction"""
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == _LEFT_BUTTON:
             self._original_rect = self.geometry()
             if self.animation_manager is not None:
                 self.animation_manager.create_button_press_animation()
@@ -166,7 +220,7 @@ class MenuIcon(QPushButton):
     def mouseReleaseEvent(self, event):
         """Material Design release interaction"""
         if self.animation_manager is not None:
-            if event.button() == Qt.MouseButton.LeftButton and self._original_rect:
+            if event.button() == _LEFT_BUTTON and self._original_rect:
                 self.animation_manager.create_button_release_animation(self._original_rect)
         super().mouseReleaseEvent(event)
 
@@ -190,78 +244,24 @@ class MenuIcon(QPushButton):
     def set_material_style(self, style_variant="primary"):
         """Apply different Material Design style variants"""
 
-        style_variants = {
-            "primary": {
-                "background": PRIMARY,
-                "hover": PRIMARY_HOVER,
-                "pressed": PRIMARY_DARK,
-                "text_color": TEXT_ON_PRIMARY
-            },
-            "secondary": {
-                "background": SECONDARY_BG,
-                "hover": SECONDARY_HOVER,
-                "pressed": SECONDARY_PRESSED,
-                "text_color": PRIMARY
-            },
-            "tertiary": {
-                "background": TERTIARY_BG,
-                "hover": TERTIARY_HOVER,
-                "pressed": TERTIARY_PRESSED,
-                "text_color": TERTIARY_TEXT
-            }
-        }
-
-        if style_variant in style_variants:
-            colors = style_variants[style_variant]
-
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {colors['background']};
-                    color: {colors['text_color']};
-                    border: none;
-                    border-radius: 28px;
-                    font-size: 12px;
-                    font-weight: 500;
-                    font-family: 'Roboto', 'Segoe UI', sans-serif;
-                    text-align: center;
-                    padding: 8px;
-                }}
-                QPushButton:hover {{
-                    background: {colors['hover']};
-                }}
-                QPushButton:pressed {{
-                    background: {colors['pressed']};
-                }}
-                QPushButton:disabled {{
-                    background: {DISABLED_BG};
-                    color: {SCROLLBAR_HANDLE_HOVER};
-                }}
-            """)
+        style = _MATERIAL_STYLES.get((style_variant, 28))
+        if style is not None:
+            self._ss_applied = True
+            self.setStyleSheet(style)
 
     def set_material_size(self, size_variant="standard"):
         """Apply different Material Design size variants"""
 
-        size_variants = {
-            "compact": QSize(80, 80),
-            "standard": QSize(112, 112),
-            "large": QSize(144, 144)
-        }
-
-        if size_variant in size_variants:
-            new_size = size_variants[size_variant]
+        if size_variant in _SIZE_VARIANTS:
+            new_size = _SIZE_VARIANTS[size_variant]
             self.setFixedSize(new_size)
 
             # Update border radius proportionally
             radius = min(new_size.width(), new_size.height()) // 4
 
-            current_style = self.styleSheet()
             # Update border-radius in stylesheet
-            import re
-            updated_style = re.sub(
-                r'border-radius:\s*\d+px',
-                f'border-radius: {radius}px',
-                current_style
-            )
+            self._ensure_style()
+            updated_style = _RADIUS_RE.sub(f'border-radius: {radius}px', self.styleSheet())
             self.setStyleSheet(updated_style)
 
             # Update icon size proportionally
@@ -5,8 +5,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal
 
 from src.plugin.settings.settings_view.schema import SettingGroup, SettingField
-from src.plugin.settings.settings_view.styles import GROUP_STYLE, LABEL_STYLE
-from src.plugin.settings.settings_view.widget_factory import get_handler, WidgetHandler
+from src.plugin.settings.settings_view.styles import GROUP_STYLE, INPUT_STYLE, LABEL_STYLE
+from src.plugin.settings.settings_view.widget_factory import get_handler_for_field, WidgetHandler
 
 
 class GenericSettingGroup(QGroupBox):
@@ -29,7 +29,7 @@ class GenericSettingGroup(QGroupBox):
 
     def __init__(self, group: SettingGroup, parent=None):
         super().__init__(group.title, parent)
-        self.setStyleSheet(GROUP_STYLE)
+        self.setStyleSheet(INPUT_STYLE + GROUP_STYLE)
         self._group = group
         self._widgets:  dict[str, QWidget]        = {}
         self._handlers: dict[str, WidgetHandler]  = {}
@@ -50,10 +50,10 @@ class GenericSettingGroup(QGroupBox):
         row = 0
         col = 0
         for f in self._group.fields:
-            handler = get_handler(f.widget_type)
+            handler = get_handler_for_field(f)
 
             cell = QWidget()
-            cell.setStyleSheet("background: transparent;")
+            cell.setObjectName("settingsCell")   # transparent via INPUT_STYLE; inputs keep their own backgrounds
             cell_layout = QVBoxLayout(cell)
             cell_layout.setContentsMargins(0, 0, 0, 0)
             cell_layout.setSpacing(6)
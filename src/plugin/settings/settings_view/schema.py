@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingField:
     key: str           # signal key, unique across the tab
     label: str         # display text
@@ -15,9 +15,28 @@ class SettingField:
     suffix: str = ""
     choices: Optional[List[str]] = None   # required when widget_type='combo'
     step_options: Optional[List[float]] = None  # touch step sizes, e.g. [1, 5, 10]
+    # WidgetHandler resolved on first use by widget_factory.get_handler_for_field
+    _handler: Any = field(default=None, init=False, repr=False, compare=False)
+    _spinbox_kwargs: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
+    @property
+    def spinbox_kwargs(self) -> dict:
+        """TouchSpinBox constructor kwargs for this field, built once."""
+        kwargs = self._spinbox_kwargs
+        if kwargs is None:
+            kwargs = self._spinbox_kwargs = dict(
+                min_val=self.min_val,
+                max_val=self.max_val,
+                initial=float(self.default) if self.default is not None else 0.0,
+                step=self.step,
+                decimals=self.decimals if self.widget_type == "double_spinbox" else 0,
+                step_options=self.step_options,
+                suffix=self.suffix,
+            )
+        return kwargs
 
-@dataclass
+
+@dataclass(slots=True)
 class SettingGroup:
     title: str
     fields: List[SettingField] = field(default_factory=list)
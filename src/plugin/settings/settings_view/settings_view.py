@@ -3,7 +3,7 @@ from typing import List
 from PyQt6.QtWidgets import (
     QWidget, QTabWidget, QVBoxLayout, QScrollArea, QPushButton
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, QSignalBlocker, Qt
 
 from src.plugin.settings.settings_view.schema import SettingGroup
 from src.plugin.settings.settings_view.group_widget import GenericSettingGroup
@@ -18,13 +18,14 @@ class SettingsView(QWidget):
         view = SettingsView("RobotSettings")
         view.add_tab("General", [ROBOT_INFO_GROUP, GLOBAL_MOTION_GROUP])
         view.add_tab("Safety",  [SAFETY_LIMITS_GROUP])
-        view.set_values(flat_dict)
+        view.set_values(flat_dict)            # emits values_loaded once
         view.value_changed_signal.connect(handler)
         view.save_requested.connect(on_save)
     """
 
     value_changed_signal = pyqtSignal(str, object, str)  # key, value, component_name
     save_requested = pyqtSignal(dict)                     # emits current values on Save
+    values_loaded = pyqtSignal()                          # once, after set_values()
 
     def __init__(self, component_name: str = "SettingsView", mapper=None, parent: QWidget = None):
         super().__init__(parent)
@@ -94,8 +95,12 @@ class SettingsView(QWidget):
         self.set_values(self._mapper(model))
 
     def set_values(self, flat: dict) -> None:
-        for group in self._groups:
-            group.set_values(flat)
+        # Groups block each input widget; blocking the view as well guarantees
+        # no value_changed_signal reaches listeners during a bulk load.
+        with QSignalBlocker(self):
+            for group in self._groups:
+                group.set_values(flat)
+        self.values_loaded.emit()
 
     def get_values(self) -> dict:
         result = {}
@@ -87,6 +87,42 @@ QGroupBox::title {{
 }}
 """
 
+# Combo boxes / line edits tagged with the settingsWidget property, plus the
+# transparent field cells (objectName "settingsCell").  Installed once per
+# GenericSettingGroup instead of on every widget.
+INPUT_STYLE = f"""
+QWidget#settingsCell {{ background: transparent; }}
+QComboBox[settingsWidget="true"] {{
+    background: white;
+    color: #333333;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 12pt;
+    min-height: 56px;
+}}
+QComboBox[settingsWidget="true"]:hover {{ border-color: {PRIMARY}; }}
+QComboBox[settingsWidget="true"]::drop-down {{ border: none; width: 40px; }}
+QComboBox[settingsWidget="true"] QAbstractItemView {{
+    background: white;
+    color: #333333;
+    selection-background-color: rgba(122, 90, 248, 0.12);
+    selection-color: {PRIMARY_DARK};
+    font-size: 11pt;
+    padding: 8px;
+}}
+QLineEdit[settingsWidget="true"] {{
+    background: white;
+    color: #333333;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 12pt;
+    min-height: 56px;
+}}
+QLineEdit[settingsWidget="true"]:focus {{ border-color: {PRIMARY}; }}
+"""
+
 SAVE_BUTTON_STYLE = f"""
 QPushButton {{
     background-color: {PRIMARY};
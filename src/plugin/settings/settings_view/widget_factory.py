@@ -12,112 +12,108 @@ Nothing else needs to change.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any, Callable
 
+from PyQt6.QtCore import QSignalBlocker
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QComboBox, QLineEdit, QWidget
 
 from src.plugin.utils_widgets.SwitchButton import QToggle
 from src.plugin.utils_widgets.int_list_widget import IntListWidget
 from src.plugin.settings.settings_view.schema import SettingField
-from src.plugin.settings.settings_view.styles import BORDER, PRIMARY, PRIMARY_DARK
 from src.plugin.utils_widgets.touch_spinbox import TouchSpinBox
 
 
-# ── shared styles ─────────────────────────────────────────────────────────────
-
-_COMBO_STYLE = f"""
-QComboBox {{
-    background: white;
-    color: #333333;
-    border: 2px solid {BORDER};
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-size: 12pt;
-    min-height: 56px;
-}}
-QComboBox:hover {{ border-color: {PRIMARY}; }}
-QComboBox::drop-down {{ border: none; width: 40px; }}
-QComboBox QAbstractItemView {{
-    background: white;
-    color: #333333;
-    selection-background-color: rgba(122, 90, 248, 0.12);
-    selection-color: {PRIMARY_DARK};
-    font-size: 11pt;
-    padding: 8px;
-}}
-"""
-
-_LINE_EDIT_STYLE = f"""
-QLineEdit {{
-    background: white;
-    color: #333333;
-    border: 2px solid {BORDER};
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-size: 12pt;
-    min-height: 56px;
-}}
-QLineEdit:focus {{ border-color: {PRIMARY}; }}
-"""
+# Shared font — Qt copies on setFont, so one instance serves every combo
+_FONT_COMBO = QFont("Arial", 12, QFont.Weight.Bold)
 
 
 # ── WidgetHandler ─────────────────────────────────────────────────────────────
 
-@dataclass
 class WidgetHandler:
     """
     All widget-type-specific knowledge in one place.
 
     create(field, emit)  — builds and returns the widget; must connect the
                            widget's change signal to emit(value).
-    get_value(widget)    — returns the widget's current value.
-    set_value(widget, v) — sets the widget's value silently (caller blocks signals).
+    get_method           — name of the widget method returning its value.
+    set_method           — name of the widget method setting its value
+                           silently (caller blocks signals).
+    coerce               — optional callable applied to the value before
+                           set_method (e.g. str, bool).
     full_width           — True → widget spans both grid columns.
+
+    get_value / set_value call the widget methods directly, without an
+    intermediate lambda frame per access.
     """
-    create:     Callable[[SettingField, Callable[[Any], None]], QWidget]
-    get_value:  Callable[[QWidget], Any]
-    set_value:  Callable[[QWidget, Any], None]
-    full_width: bool = False
+    __slots__ = ("create", "get_method", "set_method", "coerce", "full_width")
+
+    def __init__(
+        self,
+        create: Callable[[SettingField, Callable[[Any], None]], QWidget],
+        get_method: str,
+        set_method: str,
+        coerce: Callable[[Any], Any] | None = None,
+        full_width: bool = False,
+    ):
+        self.create = create
+        self.get_method = get_method
+        self.set_method = set_method
+        self.coerce = coerce
+        self.full_width = full_width
+
+    def get_value(self, w: QWidget) -> Any:
+        return getattr(w, self.get_method)()
+
+    def set_value(self, w: QWidget, v: Any) -> None:
+        if self.coerce is not None:
+            v = self.coerce(v)
+        getattr(w, self.set_method)(v)
+
+
+class _ComboHandler(WidgetHandler):
+    """Combo values are set by matching item text, not by a direct setter."""
+    __slots__ = ()
+
+    def set_value(self, w: QComboBox, v: Any) -> None:
+        idx = w.findText(str(v))
+        if idx >= 0:
+            w.setCurrentIndex(idx)
 
 
 # ── per-type factory functions ────────────────────────────────────────────────
+# Every factory follows the same order: create the widget, apply the default
+# with its signals blocked, then connect the change signal to emit — so form
+# construction never emits spurious changes into the controller.
 
 def _make_spinbox(f: SettingField, emit: Callable) -> TouchSpinBox:
-    decimals = f.decimals if f.widget_type == "double_spinbox" else 0
-    w = TouchSpinBox(
-        min_val=f.min_val,
-        max_val=f.max_val,
-        initial=float(f.default) if f.default is not None else 0.0,
-        step=f.step,
-        decimals=decimals,
-        step_options=f.step_options,
-        suffix=f.suffix,
-    )
+    w = TouchSpinBox(**f.spinbox_kwargs)   # initial value never emits
     w.valueChanged.connect(emit)
     return w
 
 
 def _make_combo(f: SettingField, emit: Callable) -> QComboBox:
     w = QComboBox()
-    w.setStyleSheet(_COMBO_STYLE)
-    w.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-    for choice in (f.choices or []):
-        w.addItem(str(choice))
-    if f.default is not None:
-        idx = w.findText(str(f.default))
-        if idx >= 0:
-            w.setCurrentIndex(idx)
+    w.setProperty("settingsWidget", True)   # styled by INPUT_STYLE on the group
+    w.setFont(_FONT_COMBO)
+    choices = [str(c) for c in (f.choices or [])]
+    with QSignalBlocker(w):
+        if choices:
+            w.addItems(choices)   # one batched model insert
+        if f.default is not None:
+            idx = w.findText(str(f.default))
+            if idx >= 0:
+                w.setCurrentIndex(idx)
     w.currentTextChanged.connect(emit)
     return w
 
 
 def _make_line_edit(f: SettingField, emit: Callable) -> QLineEdit:
     w = QLineEdit()
-    w.setStyleSheet(_LINE_EDIT_STYLE)
+    w.setProperty("settingsWidget", True)   # styled by INPUT_STYLE on the group
     if f.default is not None:
-        w.setText(str(f.default))
+        with QSignalBlocker(w):
+            w.setText(str(f.default))
     w.textChanged.connect(emit)
     return w
 
@@ -125,7 +121,8 @@ def _make_line_edit(f: SettingField, emit: Callable) -> QLineEdit:
 def _make_int_list(f: SettingField, emit: Callable) -> IntListWidget:
     w = IntListWidget(min_val=int(f.min_val), max_val=int(f.max_val))
     if f.default is not None:
-        w.set_ids(str(f.default))
+        with QSignalBlocker(w):
+            w.set_ids(str(f.default))
     w.valueChanged.connect(emit)
     return w
 
@@ -134,51 +131,23 @@ def _make_toggle(f: SettingField, emit: Callable) -> QToggle:
     w = QToggle()
     w.setFixedHeight(40)
     if f.default is not None:
-        w.setChecked(bool(f.default))
-    w.stateChanged.connect(lambda state: emit(bool(state)))
+        with QSignalBlocker(w):   # QToggle re-syncs its knob in showEvent
+            w.setChecked(bool(f.default))
+    w.toggled.connect(emit)   # toggled already carries a bool
     return w
 
 
-# ── set_value helpers ─────────────────────────────────────────────────────────
-
-def _combo_set(w: QComboBox, v: Any) -> None:
-    idx = w.findText(str(v))
-    if idx >= 0:
-        w.setCurrentIndex(idx)
-
-
 # ── registry ──────────────────────────────────────────────────────────────────
 
-_SPINBOX_HANDLER = WidgetHandler(
-    create=_make_spinbox,
-    get_value=lambda w: w.value(),
-    set_value=lambda w, v: w.setValue(float(v)),
-)
+_SPINBOX_HANDLER = WidgetHandler(_make_spinbox, "value", "setValue")   # setValue coerces itself
 
 _REGISTRY: dict[str, WidgetHandler] = {
     "spinbox":        _SPINBOX_HANDLER,
     "double_spinbox": _SPINBOX_HANDLER,
-    "combo": WidgetHandler(
-        create=_make_combo,
-        get_value=lambda w: w.currentText(),
-        set_value=_combo_set,
-    ),
-    "line_edit": WidgetHandler(
-        create=_make_line_edit,
-        get_value=lambda w: w.text(),
-        set_value=lambda w, v: w.setText(str(v)),
-    ),
-    "int_list": WidgetHandler(
-        create=_make_int_list,
-        get_value=lambda w: w.get_ids(),
-        set_value=lambda w, v: w.set_ids(v),
-        full_width=True,
-    ),
-    "toggle": WidgetHandler(
-        create=_make_toggle,
-        get_value=lambda w: w.isChecked(),
-        set_value=lambda w, v: w.setChecked(bool(v)),
-    ),
+    "combo":          _ComboHandler(_make_combo, "currentText", "setCurrentText"),
+    "line_edit":      WidgetHandler(_make_line_edit, "text", "setText", coerce=str),
+    "int_list":       WidgetHandler(_make_int_list, "get_ids", "set_ids", full_width=True),
+    "toggle":         WidgetHandler(_make_toggle, "isChecked", "setChecked", coerce=bool),
 }
 
 
@@ -190,3 +159,11 @@ def get_handler(widget_type: str) -> WidgetHandler:
             f"Unknown widget_type: {widget_type!r}. "
             f"Registered types: {sorted(_REGISTRY)}"
         )
+
+
+def get_handler_for_field(f: SettingField) -> WidgetHandler:
+    """Like get_handler, but memoizes the handler on the field itself."""
+    handler = f._handler
+    if handler is None:
+        handler = f._handler = get_handler(f.widget_type)
+    return handler
@@ -0,0 +1,38 @@
+import unittest
+
+from PyQt6.QtWidgets import QApplication
+
+from src.plugin.utils_widgets.touch_spinbox import TouchSpinBox
+
+_app = QApplication.instance() or QApplication([])
+
+
+class TestTouchSpinBox(unittest.TestCase):
+    def test_value_round_trips_beyond_display_decimals(self):
+        spin = TouchSpinBox(0.0, 10.0, initial=0.0, step=0.001, decimals=3)
+        spin.setValue(0.0025)
+        self.assertEqual(spin.value(), 0.0025)
+
+    def test_initial_value_round_trips_beyond_display_decimals(self):
+        spin = TouchSpinBox(0.0, 10.0, initial=0.0025, step=0.001, decimals=3)
+        self.assertEqual(spin.value(), 0.0025)
+
+    def test_steps_after_widening_scale(self):
+        spin = TouchSpinBox(0.0, 10.0, initial=0.0, step=0.001, decimals=3)
+        spin.setValue(0.0025)
+        spin._increment()
+        self.assertEqual(spin.value(), 0.0035)
+        spin._decrement()
+        spin._decrement()
+        self.assertEqual(spin.value(), 0.0015)
+
+    def test_value_is_clamped_to_bounds(self):
+        spin = TouchSpinBox(0.0, 1.0, initial=0.5, step=0.1, decimals=1)
+        spin.setValue(1.25)
+        self.assertEqual(spin.value(), 1.0)
+        spin.setValue(-0.05)
+        self.assertEqual(spin.value(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
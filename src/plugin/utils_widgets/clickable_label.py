@@ -21,17 +21,21 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRect
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QPointF, QRect, QTimer
 from PyQt6.QtGui import (
-    QBrush, QColor, QMouseEvent, QPainter, QPen, QPixmap, QPolygonF,
+    QBrush, QColor, QFontMetrics, QImage, QMouseEvent, QPainter, QPainterPath,
+    QPen, QPicture, QPixmap, QPolygonF,
 )
 from PyQt6.QtWidgets import QLabel, QSizePolicy
 
 
 # ── tunables ──────────────────────────────────────────────────────────────────
 _HIT_THRESHOLD   = 0.05   # normalised radius to detect a corner under cursor
+_HIT_THRESHOLD_SQ = _HIT_THRESHOLD ** 2
 _RADIUS_ACTIVE   = 9      # corner dot radius when area is active (editing)
 _RADIUS_INACTIVE = 7      # corner dot radius when area is inactive (view-only)
+_IDLE_UPGRADE_MS = 120    # quiet time before a fast-scaled frame is redrawn smoothly
+_DRAG_FRAME_MS   = 16     # drag repaints / corner_updated emits are capped at ~60 Hz
 
 # Built-in colour palette for well-known area names
 _PALETTE: Dict[str, QColor] = {
@@ -41,6 +45,40 @@ _PALETTE: Dict[str, QColor] = {
 }
 _FALLBACK_COLOR = QColor(100, 180, 255)         # blue for unknown names
 
+# Coordinate overlay badge
+_OVERLAY_PAD      = 4
+_OVERLAY_BG_BRUSH = QBrush(QColor(0, 0, 0, 140))
+_OVERLAY_TEXT     = QColor(255, 255, 255)
+
+
+# Corner index pens — dark text on light area colours, light text on dark ones
+_NUM_PEN_DARK  = QPen(QColor(0, 0, 0))
+_NUM_PEN_LIGHT = QPen(QColor(255, 255, 255))
+
+
+def _area_style(color: QColor) -> dict:
+    """Pre-built brushes / pens for drawing one area in *color*."""
+    fill_active, fill_inactive = QColor(color), QColor(color)
+    fill_active.setAlpha(55)
+    fill_inactive.setAlpha(25)
+    border_active, border_inactive = QColor(color), QColor(color)
+    border_active.setAlpha(230)
+    border_inactive.setAlpha(130)
+    halo = QColor(color).darker(160)
+    halo.setAlpha(180)
+    return {
+        "fill_active":         QBrush(fill_active),
+        "fill_inactive":       QBrush(fill_inactive),
+        "border_active_pen":   QPen(border_active, 2.0, Qt.PenStyle.SolidLine),
+        "border_inactive_pen": QPen(border_inactive, 1.2, Qt.PenStyle.DashLine),
+        "dot_brush":           QBrush(color),
+        "halo_brush":          QBrush(halo),
+        "num_pen":             _NUM_PEN_DARK if color.lightness() > 128 else _NUM_PEN_LIGHT,
+    }
+
+
+_FALLBACK_STYLE = _area_style(_FALLBACK_COLOR)
+
 
 class ClickableLabel(QLabel):
     """
@@ -81,11 +119,43 @@ class ClickableLabel(QLabel):
         # self.setStyleSheet("background: #12121F;")
 
         self._frame:        QPixmap | None                        = None
+        self._pix_buffer:   QPixmap                              = QPixmap()   # reused by set_frame_image
         self._areas:        Dict[str, List[Tuple[float, float]]] = {}
         self._colors:       Dict[str, QColor]                    = {}
+        self._style_cache:  Dict[str, dict]                      = {}
+        # Recorded drawing of every non-active area; rebuilt after layout changes
+        self._inactive_picture: QPicture | None                   = None
+        # Frame + inactive areas composited at widget size, built only while a
+        # corner is dragged so each drag repaint is one blit plus the active area
+        self._static_layer: QPixmap | None                        = None
         self._active_area:  Optional[str]                        = None
         self._drag:         Tuple[str, int]                      = ("", -1)
         self._coord_text:   str                                  = ""
+        self._coord_rect:   QRect                                = QRect()   # overlay bounds
+        self._coord_tw:     int                                  = 0         # overlay text size
+        self._coord_th:     int                                  = 0
+        self._fm:           QFontMetrics                         = QFontMetrics(self.font())
+        # Frame scaled to the label, reused until the frame or size changes
+        self._scaled_frame: QPixmap | None                        = None
+        self._scaled_key:   tuple | None                          = None
+        # Rect occupied by the scaled frame, recomputed on new frame size / resize
+        self._img_rect:     QRect                                = QRect()
+        self._img_geom:     Tuple[int, int, int, int]            = (0, 0, 0, 0)
+        # True while dragging: scale with FastTransformation and upgrade to
+        # SmoothTransformation once the drag goes quiet.
+        self._interacting:  bool                                 = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(_IDLE_UPGRADE_MS)
+        self._idle_timer.timeout.connect(self._upgrade_scale)
+        # Drag moves are buffered and flushed (repaint + emit) at most once per frame
+        self._pending_corner: Optional[Tuple[str, int, float, float]] = None
+        # (area, idx, px, py) of the last emitted drag position, in frame pixels
+        self._last_emit:      Optional[Tuple[str, int, int, int]]     = None
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(_DRAG_FRAME_MS)
+        self._repaint_timer.timeout.connect(self._flush_drag)
 
     # ── Area management ────────────────────────────────────────────────────────
 
@@ -97,6 +167,11 @@ class ClickableLabel(QLabel):
             self._colors[name] = QColor(color) if isinstance(color, str) else color
         elif name not in self._colors:
             self._colors[name] = _PALETTE.get(name, _FALLBACK_COLOR)
+        else:
+            return
+        self._style_cache[name] = _area_style(self._colors[name])
+        self._inactive_picture = None
+        self._static_layer = None
 
     def set_active_area(self, name: Optional[str]) -> None:
         """
@@ -106,6 +181,8 @@ class ClickableLabel(QLabel):
         if name and name not in self._areas:
             self.add_area(name)
         self._active_area = name
+        self._inactive_picture = None
+        self._static_layer = None
         self.update()
 
     def set_area_corners(self, name: str, points: List[Tuple[float, float]]) -> None:
@@ -113,6 +190,9 @@ class ClickableLabel(QLabel):
         if name not in self._areas:
             self.add_area(name)
         self._areas[name] = list(points)
+        if name != self._active_area:
+            self._inactive_picture = None
+            self._static_layer = None
         self.update()
 
     def get_area_corners(self, name: str) -> List[Tuple[float, float]]:
@@ -123,13 +203,31 @@ class ClickableLabel(QLabel):
         """Remove all corners for *name*."""
         if name in self._areas:
             self._areas[name] = []
+            if name != self._active_area:
+                self._inactive_picture = None
+                self._static_layer = None
             self.update()
 
     # ── Frame update ───────────────────────────────────────────────────────────
 
     def set_frame(self, pixmap: QPixmap) -> None:
         """Push a new camera frame.  Scaled to fit the label on paint."""
+        old_size = self._frame.size() if self._frame is not None else None
         self._frame = pixmap
+        self._on_frame_changed(old_size)
+
+    def set_frame_image(self, image: QImage) -> None:
+        """Push a new camera frame as a QImage, converted into a reused QPixmap."""
+        old_size = self._frame.size() if self._frame is not None else None
+        self._pix_buffer.convertFromImage(image)
+        self._frame = self._pix_buffer
+        self._on_frame_changed(old_size)
+
+    def _on_frame_changed(self, old_size) -> None:
+        self._scaled_frame = None
+        self._static_layer = None
+        if old_size is None or old_size != self._frame.size():
+            self._update_image_rect()
         self.update()
 
     # ── Mouse events ───────────────────────────────────────────────────────────
@@ -142,15 +240,15 @@ class ClickableLabel(QLabel):
             return   # click was outside the image frame — ignore
         xn, yn = norm
 
-        # Always show coordinates on every click
+        # Always show coordinates on every click (repaints just the overlay)
         self._update_coord_text(xn, yn)
-        self.update()
 
         # Only dragging in the active area
         if self._active_area and self._active_area in self._areas:
             idx = _nearest(self._areas[self._active_area], xn, yn)
             if idx >= 0:
                 self._drag = (self._active_area, idx)
+                self._mark_interacting()
                 return
 
         self._drag = ("", -1)
@@ -175,11 +273,33 @@ class ClickableLabel(QLabel):
             yn = max(0.0, min(1.0, yn))
             self._areas[area][idx] = (xn, yn)
             self._update_coord_text(xn, yn)
-            self.corner_updated.emit(area, idx, xn, yn)
-            self.update()
+            self._pending_corner = (area, idx, xn, yn)
+            self._mark_interacting()
+            if not self._repaint_timer.isActive():
+                self._repaint_timer.start()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         self._drag = ("", -1)
+        self._static_layer = None   # only kept for the duration of a drag
+        if self._repaint_timer.isActive():
+            self._repaint_timer.stop()
+            self._flush_drag()   # deliver the final drag position now
+        if self._interacting:
+            self._idle_timer.stop()
+            self._upgrade_scale()
+
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.Type.FontChange:
+            self._fm = QFontMetrics(self.font())
+            if self._coord_text:
+                self._coord_rect = self._overlay_rect()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event) -> None:
+        self._scaled_frame = None
+        self._static_layer = None
+        self._update_image_rect()
+        super().resizeEvent(event)
 
     # ── Paint ──────────────────────────────────────────────────────────────────
 
@@ -187,145 +307,244 @@ class ClickableLabel(QLabel):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Background / frame
+        # While dragging, background, frame and inactive areas come from the
+        # cached static layer; otherwise (e.g. a new streamed frame) they are
+        # drawn straight onto the widget. The active area is drawn live, on top
+        if self._drag[1] >= 0:
+            if self._static_layer is None:
+                self._static_layer = self._render_static_layer()
+            painter.drawPixmap(0, 0, self._static_layer)
+        else:
+            self._paint_static(painter)
+
+        active = self._active_area
+        if active and self._areas.get(active):
+            style = self._style_cache.get(active, _FALLBACK_STYLE)
+            self._draw_areas(painter, [(self._areas[active], style)], True)
+
+        # Coordinate overlay at top of image rect (text measured when it was set)
+        if self._coord_text:
+            r = self._img_rect
+            pad, th = _OVERLAY_PAD, self._coord_th
+            painter.setFont(self.font())
+            painter.setBrush(_OVERLAY_BG_BRUSH)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(r.x() + pad, r.y() + pad, self._coord_tw + pad * 2, th + pad * 2, 3, 3)
+            painter.setPen(_OVERLAY_TEXT)
+            painter.drawText(r.x() + pad * 2, r.y() + pad + th, self._coord_text)
+
+        painter.end()
+
+    def _render_static_layer(self) -> QPixmap:
+        """Composite background / frame and the inactive areas into one pixmap."""
+        rect = self.rect()
+        dpr = self.devicePixelRatioF()
+        layer = QPixmap(round(rect.width() * dpr), round(rect.height() * dpr))
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(layer)
+        self._paint_static(painter)
+        painter.end()
+        return layer
+
+    def _paint_static(self, painter: QPainter) -> None:
+        """Draw background / frame and the inactive areas."""
         rect = self.rect()
         if self._frame and not self._frame.isNull():
-            scaled = self._frame.scaled(
-                rect.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+            scaled = self._scaled_pixmap(rect)
             ox = (rect.width()  - scaled.width())  // 2
             oy = (rect.height() - scaled.height()) // 2
             painter.drawPixmap(ox, oy, scaled)
         else:
             painter.fillRect(rect, QColor("#12121F"))
 
-        # Draw inactive areas first, active area on top
-        order = [n for n in self._areas if n != self._active_area]
-        if self._active_area and self._active_area in self._areas:
-            order.append(self._active_area)
-
-        for name in order:
-            pts = self._areas[name]
-            if not pts:
-                continue
-            color  = self._colors.get(name, _FALLBACK_COLOR)
-            active = (name == self._active_area)
-            self._draw_area(painter, pts, color, active)
-
-        # Coordinate overlay at top of image rect
-        if self._coord_text:
-            r = self._image_rect()
-            painter.setFont(self.font())
-            fm = painter.fontMetrics()
-            tw = fm.horizontalAdvance(self._coord_text)
-            th = fm.height()
-            pad = 4
-            bg = QColor(0, 0, 0, 140)
-            painter.setBrush(QBrush(bg))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(r.x() + pad, r.y() + pad, tw + pad * 2, th + pad * 2, 3, 3)
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(r.x() + pad * 2, r.y() + pad + th, self._coord_text)
+        # Inactive areas replay a recorded picture
+        if self._inactive_picture is None:
+            self._inactive_picture = self._record_inactive_areas()
+        painter.drawPicture(0, 0, self._inactive_picture)
 
+    def _record_inactive_areas(self) -> QPicture:
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        self._draw_areas(painter, [
+            (pts, self._style_cache.get(name, _FALLBACK_STYLE))
+            for name, pts in self._areas.items()
+            if pts and name != self._active_area
+        ], False)
         painter.end()
+        return picture
 
-    def _draw_area(
+    def _draw_areas(
         self,
         painter: QPainter,
-        pts: List[Tuple[float, float]],
-        color: QColor,
+        areas: List[Tuple[List[Tuple[float, float]], dict]],
         active: bool,
     ) -> None:
-        pixel_pts = [self._to_pixel(x, y) for x, y in pts]
+        """
+        Draw (corners, style) areas phase by phase — fills, borders, dots,
+        numbers — so the shared pen/brush state is set once per phase rather
+        than once per area.
+        """
+        r  = _RADIUS_ACTIVE if active else _RADIUS_INACTIVE
+        rh = float(r + 2)
+        fill_key   = "fill_active" if active else "fill_inactive"
+        border_key = "border_active_pen" if active else "border_inactive_pen"
+
+        # float centres: no rounding jitter while dragging. The normalised →
+        # pixel mapping (_to_pixel) is inlined with the geometry read once.
+        ox, oy, w, h = self._img_geom
+        geometry = []
+        for pts, style in areas:
+            centers = [QPointF(ox + x * w, oy + y * h) for x, y in pts]
+            geometry.append((centers, QPolygonF(centers), style))
 
         # Semi-transparent fill
-        if len(pixel_pts) >= 3:
-            fill = QColor(color)
-            fill.setAlpha(55 if active else 25)
-            painter.setBrush(QBrush(fill))
-            painter.setPen(Qt.PenStyle.NoPen)
-            poly = QPolygonF([QPointF(px, py) for px, py in pixel_pts])
-            painter.drawPolygon(poly)
-
-        # Border lines
-        if len(pixel_pts) >= 2:
-            border = QColor(color)
-            border.setAlpha(230 if active else 130)
-            pen = QPen(
-                border,
-                2.0 if active else 1.2,
-                Qt.PenStyle.SolidLine if active else Qt.PenStyle.DashLine,
-            )
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            for i in range(len(pixel_pts)):
-                p1 = pixel_pts[i]
-                p2 = pixel_pts[(i + 1) % len(pixel_pts)]
-                painter.drawLine(int(p1[0]), int(p1[1]), int(p2[0]), int(p2[1]))
-
-        # Corner dots + index numbers
-        r = _RADIUS_ACTIVE if active else _RADIUS_INACTIVE
-        for i, (px, py) in enumerate(pixel_pts):
-            # Halo
-            halo = QColor(color).darker(160)
-            halo.setAlpha(180)
-            painter.setBrush(QBrush(halo))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(int(px) - r - 2, int(py) - r - 2, (r + 2) * 2, (r + 2) * 2)
-            # Dot
-            painter.setBrush(QBrush(color))
-            painter.drawEllipse(int(px) - r, int(py) - r, r * 2, r * 2)
-            # Number
-            num_color = QColor(0, 0, 0) if color.lightness() > 128 else QColor(255, 255, 255)
-            painter.setPen(num_color)
-            painter.drawText(int(px) - 4, int(py) + 5, str(i + 1))
+        painter.setPen(Qt.PenStyle.NoPen)
+        for centers, poly, style in geometry:
+            if len(centers) >= 3:
+                painter.setBrush(style[fill_key])
+                painter.drawPolygon(poly)
+
+        # Border lines — the same polygon, closed, in one call
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for centers, poly, style in geometry:
+            if len(centers) >= 2:
+                painter.setPen(style[border_key])
+                painter.drawPolygon(poly)
+
+        # Corner dots: per area all halos, then all dots, each as one path
+        painter.setPen(Qt.PenStyle.NoPen)
+        for centers, _, style in geometry:
+            halos, dots = QPainterPath(), QPainterPath()
+            halos.setFillRule(Qt.FillRule.WindingFill)   # overlapping corners stay filled
+            dots.setFillRule(Qt.FillRule.WindingFill)
+            for center in centers:
+                halos.addEllipse(center, rh, rh)
+                dots.addEllipse(center, float(r), float(r))
+            painter.setBrush(style["halo_brush"])
+            painter.drawPath(halos)
+            painter.setBrush(style["dot_brush"])
+            painter.drawPath(dots)
+
+        # Index numbers
+        for centers, _, style in geometry:
+            painter.setPen(style["num_pen"])
+            for i, c in enumerate(centers):
+                painter.drawText(int(c.x()) - 4, int(c.y()) + 5, str(i + 1))
 
     # ── Helpers ────────────────────────────────────────────────────────────────
 
+    def _flush_drag(self) -> None:
+        """Emit the latest buffered drag position and repaint once."""
+        pending, self._pending_corner = self._pending_corner, None
+        if pending is not None:
+            area, idx, xn, yn = pending
+            key = (area, idx, *self._frame_pixel(xn, yn))
+            if key != self._last_emit:   # skip sub-pixel moves
+                self._last_emit = key
+                self.corner_updated.emit(area, idx, xn, yn)
+        self.update()
+
+    def _mark_interacting(self) -> None:
+        """Use fast scaling until _IDLE_UPGRADE_MS pass without a press or drag move."""
+        self._interacting = True
+        self._idle_timer.start()
+
+    def _upgrade_scale(self) -> None:
+        self._interacting = False
+        self._static_layer = None
+        self.update()   # the cache key changes, so the frame is rescaled smoothly
+
+    def _scaled_pixmap(self, rect: QRect) -> QPixmap:
+        """The current frame scaled to *rect*, rescaled only when frame, size or mode change."""
+        mode = (Qt.TransformationMode.FastTransformation if self._interacting
+                else Qt.TransformationMode.SmoothTransformation)
+        key = (self._frame.cacheKey(), rect.width(), rect.height(), mode)
+        if self._scaled_frame is None or key != self._scaled_key:
+            self._scaled_frame = self._frame.scaled(
+                rect.size(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                mode,
+            )
+            self._scaled_key = key
+        return self._scaled_frame
+
+    def _frame_pixel(self, xn: float, yn: float) -> Tuple[int, int]:
+        """Normalised coords → integer pixel at frame resolution (image rect if no frame)."""
+        if self._frame and not self._frame.isNull():
+            return int(xn * self._frame.width()), int(yn * self._frame.height())
+        _, _, w, h = self._img_geom
+        return int(xn * w), int(yn * h)
+
     def _update_coord_text(self, xn: float, yn: float) -> None:
         """Store pixel coords (based on frame size) as a readable string for the overlay."""
-        if self._frame and not self._frame.isNull():
-            px = int(xn * self._frame.width())
-            py = int(yn * self._frame.height())
-        else:
-            r = self._image_rect()
-            px = int(xn * r.width())
-            py = int(yn * r.height())
+        px, py = self._frame_pixel(xn, yn)
         self._coord_text = f"x: {px}  y: {py}"
+        old_rect = self._coord_rect
+        self._coord_rect = self._overlay_rect()
+        self.update(self._coord_rect.united(old_rect))
+
+    def _overlay_rect(self) -> QRect:
+        """Measure the overlay text and return the badge bounds, including the descent."""
+        fm = self._fm
+        self._coord_tw = fm.horizontalAdvance(self._coord_text)
+        self._coord_th = fm.height()
+        pad = _OVERLAY_PAD
+        r = self._img_rect
+        return QRect(r.x() + pad, r.y() + pad,
+                     self._coord_tw + pad * 2, self._coord_th + pad * 2 + fm.descent())
+
+    def _update_image_rect(self) -> None:
+        """Recompute the rect (in label pixels) occupied by the scaled frame."""
+        lw, lh = self.width(), self.height()
+        if not self._frame or self._frame.isNull():
+            geom = (0, 0, lw, lh)
+        else:
+            fw, fh = self._frame.width(), self._frame.height()
+            scale  = min(lw / fw, lh / fh)
+            sw, sh = int(fw * scale), int(fh * scale)
+            geom = ((lw - sw) // 2, (lh - sh) // 2, sw, sh)
+        self._img_geom = geom
+        self._img_rect = QRect(*geom)
+        self._inactive_picture = None   # corner pixel positions moved
+        self._static_layer = None
+        if self._coord_text:
+            self._coord_rect = self._overlay_rect()   # badge follows the image corner
 
     def _image_rect(self) -> QRect:
         """Return the rect (in label pixels) occupied by the scaled frame."""
-        if not self._frame or self._frame.isNull():
-            return self.rect()
-        lw, lh = self.width(), self.height()
-        fw, fh = self._frame.width(), self._frame.height()
-        scale  = min(lw / fw, lh / fh)
-        sw, sh = int(fw * scale), int(fh * scale)
-        return QRect((lw - sw) // 2, (lh - sh) // 2, sw, sh)
+        return self._img_rect
 
     def _to_norm(self, pos: QPointF) -> Tuple[float, float] | None:
         """
         Map a label-pixel position to normalised image coords [0, 1].
         Returns *None* if the position is outside the image frame.
         """
-        r = self._image_rect()
-        if not r.contains(pos.toPoint()):
+        if not self._img_rect.contains(pos.toPoint()):
             return None
-        return (pos.x() - r.x()) / r.width(), (pos.y() - r.y()) / r.height()
+        ox, oy, w, h = self._img_geom
+        return (pos.x() - ox) / w, (pos.y() - oy) / h
 
     def _to_pixel(self, xn: float, yn: float) -> Tuple[float, float]:
         """Map normalised image coords to label-pixel coordinates."""
-        r = self._image_rect()
-        return r.x() + xn * r.width(), r.y() + yn * r.height()
+        ox, oy, w, h = self._img_geom
+        return ox + xn * w, oy + yn * h
 
 
 def _nearest(pts: List[Tuple[float, float]], xn: float, yn: float) -> int:
     """Return index of the closest point within _HIT_THRESHOLD, else -1."""
-    best_idx, best_d = -1, _HIT_THRESHOLD
+    best_idx, best_d2 = -1, _HIT_THRESHOLD_SQ
     for i, (cx, cy) in enumerate(pts):
-        d = ((cx - xn) ** 2 + (cy - yn) ** 2) ** 0.5
-        if d < best_d:
-            best_d, best_idx = d, i
+        dx = cx - xn
+        if dx >= _HIT_THRESHOLD or dx <= -_HIT_THRESHOLD:
+            continue   # outside the hit box — skip the distance maths
+        dy = cy - yn
+        if dy >= _HIT_THRESHOLD or dy <= -_HIT_THRESHOLD:
+            continue
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best_d2, best_idx = d2, i
     return best_idx
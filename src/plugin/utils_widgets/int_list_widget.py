@@ -1,6 +1,7 @@
+import re
 from typing import List, Union
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog, QFrame, QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
     QPushButton, QVBoxLayout, QWidget,
@@ -13,6 +14,11 @@ from src.plugin.settings.settings_view.styles import (
 from src.plugin.utils_widgets.touch_spinbox import TouchSpinBox
 
 
+# Whole integer tokens only: digits touching a letter, digit, dot or dash belong to
+# a float, exponent or range ("1.5", "1e3", "1-2") and are not split into IDs.
+_INT_RE = re.compile(r"(?<![\w.-])-?\d+(?![\w.-])")
+
+
 # ── Integer editor dialog ─────────────────────────────────────────────────────
 
 class _IntEditorDialog(QDialog):
@@ -99,6 +105,7 @@ class IntListWidget(QFrame):
         super().__init__(parent)
         self._min = min_val
         self._max = max_val
+        self._ids: List[int] = []   # mirrors the list rows, in order
         self.setStyleSheet(f"""
             QFrame {{
                 background: white;
@@ -152,47 +159,42 @@ class IntListWidget(QFrame):
         row = self._list.currentRow()
         if row < 0:
             return
-        try:
-            current = int(self._list.item(row).text())
-        except ValueError:
-            current = self._min
+        current = self._ids[row]
         self._open_editor("Edit ID", current, lambda v: self._update(row, v))
 
     def _on_remove(self):
         row = self._list.currentRow()
         if row >= 0:
             self._list.takeItem(row)
+            del self._ids[row]
             self.valueChanged.emit(self.get_ids())
 
     def _append(self, val: int):
         item = QListWidgetItem(str(val))
         self._list.addItem(item)
         self._list.setCurrentItem(item)
+        self._ids.append(val)
         self.valueChanged.emit(self.get_ids())
 
     def _update(self, row: int, val: int):
         self._list.item(row).setText(str(val))
+        self._ids[row] = val
         self.valueChanged.emit(self.get_ids())
 
     # ── Public API ────────────────────────────────────────────────────────
 
     def get_ids(self) -> List[int]:
-        ids = []
-        for i in range(self._list.count()):
-            try:
-                ids.append(int(self._list.item(i).text()))
-            except ValueError:
-                pass
-        return ids
+        return self._ids.copy()
 
     def set_ids(self, value: Union[List[int], str]) -> None:
-        self._list.clear()
         if isinstance(value, str):
-            ids = [int(p.strip()) for p in value.split(",") if p.strip().lstrip("-").isdigit()]
+            ids = list(map(int, _INT_RE.findall(value)))
         else:
             ids = [int(v) for v in value]
-        for id_ in ids:
-            self._list.addItem(QListWidgetItem(str(id_)))
+        with QSignalBlocker(self._list):
+            self._list.clear()
+            self._list.addItems(list(map(str, ids)))   # one batched model insert
+        self._ids = ids
 
     # Aliases so GenericSettingGroup can treat it like other widgets
     def value(self) -> List[int]:
@@ -1,10 +1,79 @@
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QFrame, QVBoxLayout
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
 from PyQt6.QtGui import QFont
 
 from src.plugin.settings.settings_view.styles import PRIMARY, PRIMARY_DARK, BORDER
 
 
+# ── shared styles / fonts (built once, reused by every instance) ─────────────
+
+_FONT_VALUE = QFont("Arial", 16, QFont.Weight.Bold)
+_FONT_PILL = QFont("Arial", 11, QFont.Weight.Bold)
+
+_FRAME_STYLE = f"""
+    QFrame {{
+        background-color: white;
+        border: 1px solid {BORDER};
+        border-radius: 10px;
+    }}
+"""
+
+_BTN_STYLE = f"""
+    QPushButton {{
+        background: white;
+        border: 1px solid {BORDER};
+        border-radius: 8px;
+        font-size: 20pt;
+        font-weight: bold;
+        color: {PRIMARY};
+    }}
+    QPushButton:hover {{
+        border: 1px solid {PRIMARY};
+        background-color: rgba(122,90,248,0.05);
+    }}
+    QPushButton:pressed {{
+        background-color: rgba(122,90,248,0.15);
+    }}
+    QPushButton:disabled {{
+        background-color: {BORDER};
+        border: 1px solid {BORDER};
+        color: #aaaaaa;
+    }}
+"""
+
+_VALUE_LABEL_STYLE = f"color: {PRIMARY_DARK}; background: transparent; border: none;"
+
+_STEP_SEL_STYLE = f"""
+    QPushButton {{
+        background-color: {PRIMARY};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0 12px;
+    }}
+"""
+
+_STEP_UNSEL_STYLE = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {PRIMARY_DARK};
+        border: 1px solid {BORDER};
+        border-radius: 8px;
+        padding: 0 12px;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(122,90,248,0.08);
+        border: 1px solid {PRIMARY};
+    }}
+"""
+
+
+def _decimal_places(v: float) -> int:
+    """Number of significant decimal places in *v* (capped at 10)."""
+    frac = f"{float(v):.10f}".rstrip("0").split(".")[1]
+    return len(frac)
+
+
 class TouchSpinBox(QFrame):
     """
     Touch-friendly stepper: large – button / value label / + button.
@@ -33,18 +102,30 @@ class TouchSpinBox(QFrame):
         self._step = float(step)
         self._decimals = decimals
         self._suffix = suffix
-        self._value = max(self._min, min(self._max, float(initial)))
+        self._fmt = self._make_formatter(decimals, suffix)
+
+        # Values are stored as integers in units of 1/_scale so stepping is
+        # exact integer arithmetic; floats only appear at the public boundary.
+        # The scale covers every decimal place of the bounds, steps and value
+        # (widened again by setValue), so a value more precise than the label
+        # still round-trips unchanged.
+        places = max([decimals, _decimal_places(min_val), _decimal_places(max_val),
+                      _decimal_places(initial)]
+                     + [_decimal_places(s) for s in (step_options or [step])])
+        self._scale = 10 ** places
+        self._imin = self._to_int(self._min)
+        self._imax = self._to_int(self._max)
+        self._istep = self._to_int(self._step)
+        self._ivalue = max(self._imin, min(self._imax, self._to_int(initial)))
+        self._last_text = None       # last text / enabled state pushed to Qt
+        self._minus_enabled = None
+        self._plus_enabled = None
         self._step_btns: dict = {}
+        self._current_step_btn = None
 
         has_steps = bool(step_options) and len(step_options) > 1
         self.setFixedHeight(128 if has_steps else 72)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 1px solid {BORDER};
-                border-radius: 10px;
-            }}
-        """)
+        self.setStyleSheet(_FRAME_STYLE)
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(8, 8, 8, 8)
@@ -57,48 +138,23 @@ class TouchSpinBox(QFrame):
         stepper_layout.setContentsMargins(0, 0, 0, 0)
         stepper_layout.setSpacing(8)
 
-        _btn_style = f"""
-            QPushButton {{
-                background: white;
-                border: 1px solid {BORDER};
-                border-radius: 8px;
-                font-size: 20pt;
-                font-weight: bold;
-                color: {PRIMARY};
-            }}
-            QPushButton:hover {{
-                border: 1px solid {PRIMARY};
-                background-color: rgba(122,90,248,0.05);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(122,90,248,0.15);
-            }}
-            QPushButton:disabled {{
-                background-color: {BORDER};
-                border: 1px solid {BORDER};
-                color: #aaaaaa;
-            }}
-        """
-
         self.minus_btn = QPushButton("−")
         self.minus_btn.setFixedSize(56, 56)
         self.minus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.minus_btn.setStyleSheet(_btn_style)
+        self.minus_btn.setStyleSheet(_BTN_STYLE)
         self.minus_btn.clicked.connect(self._decrement)
         stepper_layout.addWidget(self.minus_btn)
 
         self.value_label = QLabel()
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.value_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        self.value_label.setStyleSheet(
-            f"color: {PRIMARY_DARK}; background: transparent; border: none;"
-        )
+        self.value_label.setFont(_FONT_VALUE)
+        self.value_label.setStyleSheet(_VALUE_LABEL_STYLE)
         stepper_layout.addWidget(self.value_label, stretch=1)
 
         self.plus_btn = QPushButton("+")
         self.plus_btn.setFixedSize(56, 56)
         self.plus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.plus_btn.setStyleSheet(_btn_style)
+        self.plus_btn.setStyleSheet(_BTN_STYLE)
         self.plus_btn.clicked.connect(self._increment)
         stepper_layout.addWidget(self.plus_btn)
 
@@ -118,81 +174,110 @@ class TouchSpinBox(QFrame):
                 btn = QPushButton(label)
                 btn.setFixedHeight(44)
                 btn.setMinimumWidth(56)
-                btn.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+                btn.setFont(_FONT_PILL)
                 btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                btn.clicked.connect(lambda _, sv=s: self._select_step(sv))
+                btn.setProperty("step_value", float(s))
+                btn.clicked.connect(self._on_step_btn_clicked)
                 step_layout.addWidget(btn)
                 self._step_btns[s] = btn
 
             step_layout.addStretch()
             outer.addWidget(step_row)
             self._apply_step_styles()
+            self._current_step_btn = self._step_btns.get(self._step)
 
         self._refresh()
 
     # ------------------------------------------------------------------
+    @staticmethod
+    def _make_formatter(decimals: int, suffix: str):
+        """Return a value → label-text callable with the format spec pre-built."""
+        if decimals == 0:
+            return lambda v: f"{int(v)}{suffix}"
+        escaped = suffix.replace("{", "{{").replace("}", "}}")
+        return f"{{:.{decimals}f}}{escaped}".format
+
     @staticmethod
     def _fmt_step(s: float) -> str:
         if s == int(s):
             return str(int(s))
         return f"{s:g}"
 
+    @pyqtSlot()
+    def _on_step_btn_clicked(self):
+        self._select_step(self.sender().property("step_value"))
+
     def _select_step(self, step: float):
-        self._step = float(step)
-        self._apply_step_styles()
+        step = float(step)
+        if step == self._step:
+            return
+        # Only the previously and newly selected pills change appearance
+        if self._current_step_btn is not None:
+            self._current_step_btn.setStyleSheet(_STEP_UNSEL_STYLE)
+        btn = self._step_btns.get(step)
+        if btn is not None:
+            btn.setStyleSheet(_STEP_SEL_STYLE)
+        self._current_step_btn = btn
+        self._step = step
+        self._istep = self._to_int(step)
 
     def _apply_step_styles(self):
-        selected = f"""
-            QPushButton {{
-                background-color: {PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 12px;
-            }}
-        """
-        unselected = f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {PRIMARY_DARK};
-                border: 1px solid {BORDER};
-                border-radius: 8px;
-                padding: 0 12px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(122,90,248,0.08);
-                border: 1px solid {PRIMARY};
-            }}
-        """
         for s, btn in self._step_btns.items():
-            btn.setStyleSheet(selected if s == self._step else unselected)
+            btn.setStyleSheet(_STEP_SEL_STYLE if s == self._step else _STEP_UNSEL_STYLE)
 
     # ------------------------------------------------------------------
+    def _to_int(self, v) -> int:
+        return round(float(v) * self._scale)
+
+    def _widen_scale(self, v) -> None:
+        """Grow _scale so *v* is stored exactly, rescaling the stored integers."""
+        scale = 10 ** _decimal_places(v)
+        if scale <= self._scale:
+            return
+        factor = scale // self._scale
+        self._scale = scale
+        self._imin *= factor
+        self._imax *= factor
+        self._istep *= factor
+        self._ivalue *= factor
+
     def _refresh(self):
-        if self._decimals == 0:
-            text = f"{int(self._value)}{self._suffix}"
-        else:
-            text = f"{self._value:.{self._decimals}f}{self._suffix}"
-        self.value_label.setText(text)
-        self.minus_btn.setEnabled(self._value > self._min)
-        self.plus_btn.setEnabled(self._value < self._max)
+        text = self._fmt(self.value())
+        if text != self._last_text:
+            self.value_label.setText(text)
+            self._last_text = text
+        minus_enabled = self._ivalue > self._imin
+        if minus_enabled != self._minus_enabled:
+            self.minus_btn.setEnabled(minus_enabled)
+            self._minus_enabled = minus_enabled
+        plus_enabled = self._ivalue < self._imax
+        if plus_enabled != self._plus_enabled:
+            self.plus_btn.setEnabled(plus_enabled)
+            self._plus_enabled = plus_enabled
 
     def _increment(self):
-        self._value = min(round(self._value + self._step, 10), self._max)
+        ivalue = min(self._ivalue + self._istep, self._imax)
+        if ivalue == self._ivalue:
+            return   # already clamped at max
+        self._ivalue = ivalue
         self._refresh()
-        self.valueChanged.emit(self._value)
+        self.valueChanged.emit(self.value())
 
     def _decrement(self):
-        self._value = max(round(self._value - self._step, 10), self._min)
+        ivalue = max(self._ivalue - self._istep, self._imin)
+        if ivalue == self._ivalue:
+            return   # already clamped at min
+        self._ivalue = ivalue
         self._refresh()
-        self.valueChanged.emit(self._value)
+        self.valueChanged.emit(self.value())
 
     # ------------------------------------------------------------------
     def value(self) -> float:
-        return self._value
+        return self._ivalue / self._scale
 
     def setValue(self, val):
-        self._value = max(self._min, min(self._max, float(val)))
+        self._widen_scale(val)
+        self._ivalue = max(self._imin, min(self._imax, self._to_int(val)))
         self._refresh()
 
     def clear(self):
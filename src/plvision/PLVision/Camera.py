@@ -10,13 +10,19 @@ New optional keyword params (use by name):
   - fps: desired capture fps (float)
   - open_timeout: seconds to keep trying to open the device
   - retries: number of retries when reading frames
+  - buffer_size: driver-side frame queue length (CAP_PROP_BUFFERSIZE); 1 keeps
+    capture() on the newest frame instead of one up to N frames old
 
 Public methods:
-  - capture(grab_only=False): return frame (or None)
+  - capture(grab_only=False): return the newest frame (or None)
+  - start_reader_thread(), stop_reader_thread(): keep the driver drained from a
+    background thread so capture() just returns the latest snapshot
   - isOpened(), close(), get_properties(), set_resolution(), set_fps(), set_fourcc()
 """
+import itertools
 import time
 import platform
+import threading
 
 import cv2
 
@@ -24,7 +30,8 @@ import cv2
 class Camera:
     def __init__(self, cameraIndex=0, width=1280, height=720, *,
                  device=None, backend=None, fourcc=None, fps=None,
-                 open_timeout=5.0, retries=3, mjpg_preferred=True, verbose_ae=False):
+                 open_timeout=5.0, retries=3, mjpg_preferred=True, verbose_ae=False,
+                 buffer_size=1):
         # Backwards-compatible behavior
         if device is None:
             self.device = cameraIndex
@@ -35,9 +42,14 @@ class Camera:
         self.height = int(height)
         self.requested_fps = float(fps) if fps is not None else None
         self.requested_fourcc = (fourcc if isinstance(fourcc, str) else None)
+        # FOURCC codes resolved once; _configure_capture runs on every stream restart
+        self._mjpg_fourcc = cv2.VideoWriter_fourcc(*'MJPG')
+        self._requested_fourcc_int = (cv2.VideoWriter_fourcc(*self.requested_fourcc)
+                                      if self.requested_fourcc is not None else None)
         self.open_timeout = float(open_timeout)
         self.retries = int(retries)
         self.mjpg_preferred = bool(mjpg_preferred)
+        self.buffer_size = int(buffer_size) if buffer_size is not None else None
         # If true, set_auto_exposure will print each candidate tried
         self.verbose_ae = bool(verbose_ae)
 
@@ -51,9 +63,26 @@ class Camera:
             elif isinstance(backend, int):
                 self.backend = backend
 
+        # The device and platform never change for this object, so pick the backend once
+        self._resolved_backend = self._select_backend()
+
         self.cap = None
+        self._props_cache = None  # get_properties() result for the current configuration
+        self._frame_buf = None  # decode target for capture(reuse_buffer=True)
+        self._open_params_supported = True  # cleared if OpenCV lacks the open-params overload
+        self._frame_interval = 1.0 / (self.requested_fps or 30.0)
+        self._max_drain = max(1, self.buffer_size or 4)
         self.open_start_time = None
         self.active = False  # Indicates if camera is active and initialized
+        # Background reader state: one (frame, timestamp) slot, overwritten per frame
+        self._latest = (None, 0.0)
+        self._latest_lock = threading.Lock()
+        self._latest_cond = threading.Condition(self._latest_lock)  # notified per new frame
+        # Oldest snapshot capture() hands out while the reader runs; None means
+        # two frame intervals, 0 disables the check
+        self.max_frame_age_ms = None
+        self._reader = None
+        self._reader_stop = threading.Event()
         self._init_capture()
 
     # def _resolve_backend_for_platform(self):
@@ -66,6 +95,10 @@ class Camera:
     #     return getattr(cv2, 'CAP_ANY', 0)
 
     def _resolve_backend_for_platform(self):
+        """Backend chosen for this device/platform; resolved once in __init__."""
+        return self._resolved_backend
+
+    def _select_backend(self):
         # If device is a URL, just use CAP_FFMPEG
         if isinstance(self.device, str) and self.device.startswith(("http://", "https://")):
             return getattr(cv2, "CAP_FFMPEG", 0)
@@ -93,11 +126,70 @@ class Camera:
     #     except Exception:
     #         return None
 
+    def _stream_open_params(self):
+        """Open/read timeouts for network streams, so a dead URL fails fast instead of hanging."""
+        if not hasattr(cv2, 'CAP_PROP_OPEN_TIMEOUT_MSEC'):
+            return []
+        timeout_ms = int(self.open_timeout * 1000)
+        params = [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, timeout_ms,
+                  cv2.CAP_PROP_READ_TIMEOUT_MSEC, timeout_ms]
+        # Let FFmpeg decode on VAAPI/NVDEC/... when the build supports it
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            params += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        return params
+
+    def _device_open_params(self):
+        """Pixel format, size and fps handed to the backend at open time, so it can skip format probing."""
+        fourcc = self._requested_fourcc_int
+        if fourcc is None and self.mjpg_preferred:
+            fourcc = self._mjpg_fourcc
+        params = [cv2.CAP_PROP_FRAME_WIDTH, self.width, cv2.CAP_PROP_FRAME_HEIGHT, self.height]
+        if fourcc is not None:
+            params = [cv2.CAP_PROP_FOURCC, fourcc] + params
+        if self.requested_fps is not None:
+            params += [cv2.CAP_PROP_FPS, int(self.requested_fps)]
+        return params
+
     def _attempt_open(self, device, api):
-        try:
+        """
+        Open device, passing its configuration as open parameters first.
+
+        Backends that reject an open parameter fail the whole open, so on
+        failure the plain open is tried too. A failed open may just as well
+        be a busy or unplugged device, so the parameters are offered again on
+        the next open; they are only dropped for good when this OpenCV build
+        has no params overload at all. _configure_capture still applies
+        every setting afterwards either way.
+        """
+        is_url = isinstance(device, str) and device.startswith(("http://", "https://"))
+        if is_url:
+            api = getattr(cv2, "CAP_FFMPEG", 0)
+            params = self._stream_open_params()
+        else:
+            params = self._device_open_params()
+
+        if self._open_params_supported and params and api is not None:
+            try:
+                cap = self._open_or_release(device, api, params)
+            except TypeError:
+                # No VideoCapture(device, api, params) overload in this OpenCV build
+                self._open_params_supported = False
+                cap = None
+            if cap is not None:
+                return cap
+
+        if is_url:
             # If the device looks like a URL, just pass it directly
-            if isinstance(device, str) and (device.startswith("http://") or device.startswith("https://")):
-                cap = cv2.VideoCapture(device)
+            cap = self._open_or_release(device, None)
+        else:
+            cap = self._open_or_release(device, api)
+        return cap
+
+    @staticmethod
+    def _open_or_release(device, api, params=None):
+        try:
+            if params:
+                cap = cv2.VideoCapture(device, api, params)
             else:
                 cap = cv2.VideoCapture(device, api) if api is not None else cv2.VideoCapture(device)
 
@@ -110,6 +202,10 @@ class Camera:
             except Exception:
                 pass
             return None
+        except TypeError:
+            if params:
+                raise  # overload missing; _attempt_open stops offering params
+            return None
         except Exception:
             return None
 
@@ -131,36 +227,49 @@ class Camera:
         if api != any_api:
             apis_to_try.append(any_api)
 
-        for attempt_target in tries:
-            for a in apis_to_try:
-                while time.time() <= deadline:
-                    cap = self._attempt_open(attempt_target, a)
-                    if cap is not None:
-                        self.cap = cap
-                        self._configure_capture()
-                        self.active = True
-                        return
-                    time.sleep(0.1)
-                    if time.time() > deadline:
-                        break
+        # Round-robin over every (target, api) pair under one shared deadline,
+        # backing off between passes from 5 ms up to 50 ms
+        candidates = list(itertools.product(tries, apis_to_try))
+        delay = 0.005
+        while True:
+            for attempt_target, a in candidates:
+                cap = self._attempt_open(attempt_target, a)
+                if cap is not None:
+                    self.cap = cap
+                    self._configure_capture()
+                    self.active = True
+                    return
+            if time.time() + delay > deadline:
+                break
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.05)
         # failed to open within timeout
         self.active = False
 
     def _configure_capture(self):
+        self._props_cache = None
         # Set FOURCC first if requested
-        if self.requested_fourcc is not None:
+        if self._requested_fourcc_int is not None:
             try:
-                fourcc_int = cv2.VideoWriter_fourcc(*self.requested_fourcc)
-                self.cap.set(cv2.CAP_PROP_FOURCC, fourcc_int)
+                self.cap.set(cv2.CAP_PROP_FOURCC, self._requested_fourcc_int)
             except Exception:
                 pass
         else:
             if self.mjpg_preferred:
                 try:
-                    self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
+                    self.cap.set(cv2.CAP_PROP_FOURCC, self._mjpg_fourcc)
                 except Exception:
                     pass
 
+        # Cap the driver-side queue so capture() returns the newest frame
+        if self.buffer_size is not None:
+            try:
+                ok = self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+            except Exception:
+                ok = False
+            if not ok:
+                print(f"[Camera] backend ignored CAP_PROP_BUFFERSIZE={self.buffer_size}")
+
         # Set resolution
         try:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(self.width))
@@ -175,50 +284,92 @@ class Camera:
             except Exception:
                 pass
 
-        time.sleep(0.05)
+        # Wait (at most 50 ms) only until the driver reports the new configuration
+        deadline = time.perf_counter() + 0.05
+        try:
+            while not self.cap.get(cv2.CAP_PROP_FRAME_WIDTH) and time.perf_counter() < deadline:
+                time.sleep(0.001)
+        except Exception:
+            pass
 
     # Public API
     def isOpened(self):
         self.active = (self.cap is not None) and self.cap.isOpened()
         return self.active
 
-    def get_properties(self):
+    def get_properties(self, force_refresh=False):
+        """
+        Return width/height/fps/fourcc/backend as reported by the driver.
+
+        The result is cached until the configuration changes (set_resolution,
+        set_fps, set_fourcc, stream restart), so per-frame callers do not
+        re-query the device. force_refresh=True queries the driver anyway.
+        """
+        if self._props_cache is not None and self.active and not force_refresh:
+            return self._props_cache
         if not self.isOpened():
             return {}
-        return {
+        self._props_cache = {
             'width': int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
             'height': int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
             'fps': float(self.cap.get(cv2.CAP_PROP_FPS)),
             'fourcc': int(self.cap.get(cv2.CAP_PROP_FOURCC)),
             'backend_name': (self.cap.getBackendName() if hasattr(self.cap, 'getBackendName') else None)
         }
+        return self._props_cache
 
     def set_resolution(self, width, height):
         if not self.isOpened():
             raise RuntimeError('Camera not opened')
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(width))
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, int(height))
-        time.sleep(0.02)
+        # Keep the requested configuration current so stream restarts reapply it
+        self.width, self.height = int(width), int(height)
+        self._props_cache = None
+        self._await_property(cv2.CAP_PROP_FRAME_WIDTH, self.width)
 
     def set_fps(self, fps):
         if not self.isOpened():
             raise RuntimeError('Camera not opened')
         self.cap.set(cv2.CAP_PROP_FPS, float(fps))
-        time.sleep(0.02)
+        self.requested_fps = float(fps)
+        self._frame_interval = 1.0 / float(fps)
+        self._props_cache = None
+        self._await_property(cv2.CAP_PROP_FPS, int(fps))
 
     def set_fourcc(self, fourcc_str):
         if not self.isOpened():
             raise RuntimeError('Camera not opened')
-        fourcc_int = cv2.VideoWriter_fourcc(*fourcc_str)
+        fourcc_int = self._mjpg_fourcc if fourcc_str == 'MJPG' else cv2.VideoWriter_fourcc(*fourcc_str)
         self.cap.set(cv2.CAP_PROP_FOURCC, fourcc_int)
-        time.sleep(0.02)
+        self._props_cache = None
+        self._await_property(cv2.CAP_PROP_FOURCC, fourcc_int)
+
+    def _await_property(self, prop, target, attempts=20):
+        """
+        Poll prop every 1 ms until the driver reports target (as int).
+
+        Replaces a fixed settle sleep: cooperative drivers apply settings
+        synchronously and return at once; others get at most ~20 ms, the
+        old fixed delay.
+        """
+        for _ in range(attempts):
+            try:
+                if int(self.cap.get(prop)) == target:
+                    return
+            except Exception:
+                return
+            time.sleep(0.001)
 
     def set_auto_exposure(self, enabled: bool):
         """
         Change AE mode reliably by restarting stream.
         """
 
-        # Stop stream (required for many UVC cameras)
+        # Stop stream (required for many UVC cameras); the reader resumes afterwards
+        resume_reader = self._reader is not None
+        if resume_reader and not self.stop_reader_thread():
+            raise RuntimeError("Camera reader did not stop while changing auto exposure (device may be busy)")
         self.stop_stream()
         time.sleep(0.2)  # Increased wait time for device release
 
@@ -254,6 +405,8 @@ class Camera:
             except:
                 continue
 
+        if resume_reader:
+            self.start_reader_thread()
         try:
             return self.cap.get(cv2.CAP_PROP_AUTO_EXPOSURE)
         except:
@@ -279,34 +432,145 @@ class Camera:
             print(f"Camera Active: {self.active}")
             pass
 
-    def capture(self, grab_only=False, timeout=1.0):
-        if not self.isOpened():
+    def capture(self, grab_only=False, timeout=1.0, reuse_buffer=False):
+        """
+        Return the newest frame (or None).
+
+        Buffered frames are skipped with grab() alone: a grab that returns
+        almost immediately came out of the driver queue, one that blocks was
+        waiting on the sensor, so the queue is empty. Only that last frame is
+        decoded with retrieve(). ``grab_only`` is kept for compatibility;
+        every call now takes the grab/retrieve path.
+
+        While the background reader runs, start_reader_thread() shadows this
+        method on the instance with _capture_latest, so neither path pays a
+        per-frame check for the other.
+
+        reuse_buffer=True decodes into one array owned by the camera instead
+        of allocating a new frame each call; the returned array is then
+        overwritten by the next such call, so callers that keep or modify it
+        must copy. Ignored while the reader thread runs.
+        """
+        # self.active is kept current by open/close; isOpened() is only
+        # consulted after a failed read, to notice a lost device.
+        cap = self.cap
+        if not self.active or cap is None:
             return None
 
-        start = time.time()
-        while True:
-            if grab_only:
-                try:
-                    ok = self.cap.grab()
-                    if not ok and (time.time() - start) > timeout:
-                        return None
-                    if not ok:
-                        continue
-                    ok, frame = self.cap.retrieve()
-                except Exception:
+        clock = time.perf_counter
+        deadline = clock() + timeout
+        try:
+            while True:
+                t0 = clock()
+                if cap.grab():
+                    break
+                if clock() > deadline:
+                    self.isOpened()
                     return None
+            # Drain whatever the driver still has queued, at most buffer_size frames
+            fresh = self._frame_interval * 0.5
+            grabbed_in = clock() - t0
+            drained = 0
+            while grabbed_in < fresh and drained < self._max_drain:
+                t0 = clock()
+                if not cap.grab():
+                    break
+                grabbed_in = clock() - t0
+                drained += 1
+            if reuse_buffer:
+                # retrieve() reuses the array when size/type match, else allocates a new one
+                ok, frame = cap.retrieve(self._frame_buf)
+                if ok:
+                    self._frame_buf = frame
             else:
-                try:
-                    ok, frame = self.cap.read()
-                except Exception:
+                ok, frame = cap.retrieve()
+        except Exception:
+            self.isOpened()
+            return None
+        return frame if ok else None
+
+    def start_reader_thread(self):
+        """
+        Grab frames on a daemon thread so consumers never wait on the driver.
+
+        While running, capture() returns the most recent frame without
+        touching the device; the same array is returned until a newer frame
+        arrives, so callers that draw on it should copy first.
+        """
+        if self._reader is not None:
+            if self._reader.is_alive():
+                return  # running, or still stuck in the driver after a stop
+            self.stop_reader_thread()  # reap a reader that exited after a timed-out stop
+        self._reader_stop.clear()
+        self._reader = threading.Thread(target=self._reader_loop, name="CameraReader", daemon=True)
+        self._reader.start()
+        self.capture = self._capture_latest
+
+    def _capture_latest(self, grab_only=False, timeout=1.0, reuse_buffer=False):
+        """
+        capture() while the reader thread runs: the latest snapshot, never touching the device.
+
+        A snapshot grabbed longer ago than max_frame_age_ms is not returned;
+        the call waits (up to timeout) for the reader to publish a newer one
+        and returns None if none arrives.
+        """
+        max_age = self.max_frame_age_ms
+        max_age = 2.0 * self._frame_interval if max_age is None else max_age / 1000.0
+        with self._latest_cond:
+            frame, grabbed_at = self._latest
+            if max_age and time.perf_counter() - grabbed_at > max_age:
+                if not self._latest_cond.wait_for(lambda: self._latest[1] > grabbed_at, timeout):
                     return None
+                frame = self._latest[0]
+            return frame
 
-            if ok:
-                return frame
-            if (time.time() - start) > timeout:
-                return None
+    def stop_reader_thread(self):
+        """
+        Stop the background reader. Returns True if one was running and has exited.
+
+        Returns False if none was running, or if it is still blocked in the
+        driver after the join timeout. A blocked reader stays in _reader so
+        no second reader starts next to it, and close()/stop_stream() leave
+        the device open rather than release it under the pending grab.
+        """
+        reader = self._reader
+        if reader is None:
+            return False
+        self._reader_stop.set()
+        reader.join(timeout=1.0)
+        if reader.is_alive():
+            return False
+        self._reader = None
+        del self.capture  # back to the class's direct grab/retrieve path
+        return True
+
+    def _reader_loop(self):
+        stop = self._reader_stop
+        clock = time.perf_counter
+        while not stop.is_set():
+            cap = self.cap
+            if cap is None:
+                stop.wait(0.01)
+                continue
+            try:
+                ok = cap.grab()
+                grabbed_at = clock()  # frame age is measured from the grab, not the decode
+                if ok:
+                    ok, frame = cap.retrieve()
+            except Exception:
+                ok = False
+            if not ok:
+                stop.wait(0.001)  # avoid a busy loop while the device recovers
+                continue
+            snapshot = (frame, grabbed_at)
+            with self._latest_cond:
+                self._latest = snapshot
+                self._latest_cond.notify_all()
 
     def close(self):
+        self.stop_reader_thread()
+        if self._reader is not None:
+            return  # reader still inside grab(); see stop_reader_thread()
         if self.cap is not None:
             try:
                 self.cap.release()
@@ -321,6 +585,9 @@ class Camera:
 
     def stop_stream(self):
         """Stop the camera stream without destroying Camera object."""
+        self.stop_reader_thread()
+        if self._reader is not None:
+            return  # reader still inside grab(); see stop_reader_thread()
         if self.cap is not None:
             try:
                 self.cap.release()
@@ -332,22 +599,20 @@ class Camera:
     def start_stream(self):
         """Restart camera stream with previous parameters. Retry if device is busy."""
         api = self._resolve_backend_for_platform()
-        max_retries = 10
-        delay = 0.1
-        for attempt in range(max_retries):
-            self.cap = cv2.VideoCapture(self.device, api)
-            if self.cap is not None and self.cap.isOpened():
+        # Same ~1 s budget as the former 10 x 100 ms retries, polled with backoff
+        deadline = time.perf_counter() + 1.0
+        delay = 0.005
+        while True:
+            self.cap = self._attempt_open(self.device, api)
+            if self.cap is not None:
                 self._configure_capture()
                 self.active = True
                 return
-            if self.cap is not None:
-                try:
-                    self.cap.release()
-                except Exception:
-                    pass
-            self.cap = None
+            if time.perf_counter() + delay > deadline:
+                break
             time.sleep(delay)
-        # If we reach here, failed to open after retries
+            delay = min(delay * 1.5, 0.05)
+        # If we reach here, failed to open within the budget
         self.cap = None
         self.active = False
 
@@ -382,7 +647,7 @@ if __name__ == '__main__':
         print('Failed to open camera - run collect_camera_info.sh for diagnostics')
         sys.exit(2)
 
-    def print_help():
+    def print_help(cam=None, state=None):
         print('\nInteractive keys:')
         print('  q : quit')
         print('  t : toggle auto-exposure (on/off)')
@@ -394,20 +659,90 @@ if __name__ == '__main__':
         print('  p : print properties')
         print('  h : print this help')
 
-    print_help()
+    # ── key handlers: (cam, state) -> None; state['quit'] ends the loop ──
+
+    def _quit(cam, state):
+        state['quit'] = True
+
+    def _print_props(cam, state):
+        print('Properties:', cam.get_properties(force_refresh=True))
+
+    def _toggle_ae(cam, state):
+        ae = cam.get_auto_exposure()
+        try:
+            ae_on = (float(ae) == 3.0)
+        except Exception:
+            ae_on = bool(ae)
+        cam.set_auto_exposure(not ae_on)
+        state['exposure'] = None  # the driver may pick a new exposure
+        print('AE toggled ->', cam.get_auto_exposure())
+
+    def _step_exposure(delta):
+        def handler(cam, state):
+            cur = state['exposure']
+            if cur is None:
+                # Read from the driver only once; afterwards track what we set
+                try:
+                    cur = float(cam.cap.get(cv2.CAP_PROP_EXPOSURE))
+                except Exception:
+                    return
+            cur += delta
+            cam.set_exposure(cur)
+            state['exposure'] = cur
+            print('Exposure increased:' if delta > 0 else 'Exposure decreased:', cur)
+        return handler
+
+    _NEXT_RES = {(1920, 1080): (1280, 720), (1280, 720): (640, 480)}
+    _NEXT_FPS = {60: 30, 30: 15}
+
+    def _cycle_resolution(cam, state):
+        new_res = _NEXT_RES.get((cam.width, cam.height), (1920, 1080))
+        cam.set_resolution(*new_res)
+        print('Resolution changed:', new_res)
+
+    def _cycle_fps(cam, state):
+        new_fps = _NEXT_FPS.get(cam.get_properties().get('fps', 30), 60)
+        cam.set_fps(new_fps)
+        print('FPS changed:', new_fps)
+
+    def _toggle_mjpg(cam, state):
+        cam.mjpg_preferred = not cam.mjpg_preferred
+        if cam.mjpg_preferred:
+            cam.set_fourcc('MJPG')
+            print('MJPG preferred')
+        else:
+            # No FOURCC to force; the driver default applies on the next stream restart
+            print('Default pixel format preferred')
+
+    _increase_exposure = _step_exposure(+0.5)
+    _decrease_exposure = _step_exposure(-0.5)
+    _KEY_ACTIONS = {
+        ord('q'): _quit,
+        ord('p'): _print_props,
+        ord('h'): print_help,
+        ord('t'): _toggle_ae,
+        ord('+'): _increase_exposure, ord('='): _increase_exposure,
+        ord('-'): _decrease_exposure, ord('_'): _decrease_exposure,
+        ord('r'): _cycle_resolution,
+        ord('f'): _cycle_fps,
+        ord('m'): _toggle_mjpg,
+    }
+    # pollKey() does not block (waitKey(1) can round up to ~15 ms on Windows)
+    poll_key = getattr(cv2, 'pollKey', None) or (lambda: cv2.waitKey(1))
 
     start_time = time.time()
     frames = 0
     fps_sum = 0.0
     last_time = None
     last_key_time = 0.0
+    state = {'quit': False, 'exposure': None}
 
     try:
         while True:
             if duration > 0 and (time.time() - start_time) >= duration:
                 break
 
-            frame = cam.capture(grab_only=False, timeout=1.0)
+            frame = cam.capture(timeout=1.0, reuse_buffer=True)  # frame is drawn on and shown, never kept
             if frame is None:
                 # failed to grab -- try again
                 time.sleep(0.01)
@@ -422,88 +757,28 @@ if __name__ == '__main__':
             last_time = now
             fps_sum += inst_fps
 
-            # overlay info
-            props = cam.get_properties()
+            # overlay info (requested values are kept on the camera; no driver query per frame)
             try:
-                cv2.putText(frame, f"FPS target: {props.get('fps')}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0,255,0), 2)
+                cv2.putText(frame, f"FPS target: {cam.requested_fps}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0,255,0), 2)
                 cv2.putText(frame, f"Inst: {inst_fps:.2f} Avg: {(fps_sum/frames if frames>0 else 0.0):.2f}", (10,70), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0,255,255), 2)
             except Exception:
                 pass
 
             cv2.imshow('Camera Demo', frame)
 
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
+            if key == 255:
+                continue
             now_key = time.time()
             # debounce quick repeats (0.15s)
-            if (now_key - last_key_time) < 0.15 and key != 255:
+            if (now_key - last_key_time) < 0.15:
                 continue
-            if key != 255:
-                last_key_time = now_key
-                if key == ord('q'):
+            last_key_time = now_key
+            handler = _KEY_ACTIONS.get(key)
+            if handler is not None:
+                handler(cam, state)
+                if state['quit']:
                     break
-                if key == ord('p'):
-                    print('Properties:', cam.get_properties())
-                elif key == ord('h'):
-                    print_help()
-                elif key == ord('t'):
-                    ae = cam.get_auto_exposure()
-                    try:
-                        ae_on = (float(ae) == 3.0)
-                    except Exception:
-                        ae_on = bool(ae)
-                    cam.set_auto_exposure(not ae_on)
-                    print('AE toggled ->', cam.get_auto_exposure())
-                elif key in (ord('+'), ord('=')):
-                    try:
-                        cur = cam.cap.get(cv2.CAP_PROP_EXPOSURE)
-                        cur = float(cur) if cur is not None else None
-                    except Exception:
-                        cur = None
-                    if cur is not None:
-                        cam.set_exposure(cur + 0.5)
-                        print('Exposure increased:', cur + 0.5)
-                elif key in (ord('-'), ord('_')):
-                    try:
-                        cur = cam.cap.get(cv2.CAP_PROP_EXPOSURE)
-                        cur = float(cur) if cur is not None else None
-                    except Exception:
-                        cur = None
-                    if cur is not None:
-                        cam.set_exposure(cur - 0.5)
-                        print('Exposure decreased:', cur - 0.5)
-                elif key == ord('r'):
-                    # Cycle resolution
-                    cur_res = (cam.width, cam.height)
-                    new_res = None
-                    if cur_res == (1920, 1080):
-                        new_res = (1280, 720)
-                    elif cur_res == (1280, 720):
-                        new_res = (640, 480)
-                    else:
-                        new_res = (1920, 1080)
-                    cam.set_resolution(*new_res)
-                    print('Resolution changed:', new_res)
-                elif key == ord('f'):
-                    # Cycle fps
-                    cur_fps = cam.get_properties().get('fps', 30)
-                    new_fps = None
-                    if cur_fps == 60:
-                        new_fps = 30
-                    elif cur_fps == 30:
-                        new_fps = 15
-                    else:
-                        new_fps = 60
-                    cam.set_fps(new_fps)
-                    print('FPS changed:', new_fps)
-                elif key == ord('m'):
-                    # Toggle MJPG preference
-                    cam.mjpg_preferred = not cam.mjpg_preferred
-                    if cam.mjpg_preferred:
-                        cam.set_fourcc('MJPG')
-                        print('MJPG preferred')
-                    else:
-                        cam.set_fourcc(None)
-                        print('Default pixel format preferred')
     except KeyboardInterrupt:
         pass
     except Exception as e:
@@ -16,16 +16,59 @@ import numpy as np
 from ..PID.PIDController import PIDController
 
 
+def _luma(channel_means):
+    """BT.601 luma (the COLOR_BGR2GRAY weights) of a cv2.mean() result."""
+    b, g, r, _ = channel_means
+    return 0.114 * b + 0.587 * g + 0.299 * r
+
+
+def _pid_step(error, prev_error, integral, Kp, Ki, Kd, lo, hi):
+    """
+    One anti-windup PID step on plain floats.
+
+    Returns (clamped_output, new_integral, new_previous_error). Written with
+    scalar comparisons rather than np.clip/np.sign, which box every operand
+    into a 0-d array and cost far more than the arithmetic itself.
+    """
+    # Compute unclamped output from the proportional, integral and derivative terms
+    output = Kp * error + Ki * integral + Kd * (error - prev_error)
+
+    # Clamp the output
+    clamped = lo if output < lo else hi if output > hi else output
+
+    # Anti-windup: only integrate if not saturated
+    # or if integration would reduce the error
+    if clamped == output or ((error > 0) - (error < 0)) != ((integral > 0) - (integral < 0)):
+        integral += error
+    # else: don't integrate when saturated to prevent windup
+
+    return clamped, integral, error
+
+
 class BrightnessController(PIDController):
-    def __init__(self, Kp, Ki, Kd, setPoint):
+    def __init__(self, Kp, Ki, Kd, setPoint, use_opencl=False):
         super().__init__(Kp, Ki, Kd, setPoint)
         self.output_min = -255  # Full range to handle any lighting condition
         self.output_max = 255
+        # Run the full-frame adjustment through OpenCV's T-API (OpenCL) when
+        # asked for and available; off by default since the upload/download
+        # only pays off on devices that share memory with the GPU.
+        self.use_opencl = bool(use_opencl) and cv2.ocl.haveOpenCL()
+        # Cached ROI crop and mask, see _roi_geometry()
+        self._roi_key = None
+        self._roi_cached = None
+        # Output buffer reused by adjustBrightness()
+        self._scale_dst = None
 
     def calculateBrightness(self, frame, roi_points=None):
         """
         Calculate the brightness of a frame, optionally within a specific region of interest.
 
+        Brightness is the BT.601 luma of the per-channel means, which equals the
+        mean of the grayscale image without writing one out. Only the ROI's
+        bounding box is averaged; the polygon mask is built once per ROI/frame
+        size and skipped entirely for axis-aligned rectangles.
+
         Args:
             frame (np.array): The frame to calculate the brightness of.
             roi_points (np.array, optional): Points defining the region of interest. 
@@ -34,32 +77,55 @@ class BrightnessController(PIDController):
         Returns:
             float: The brightness of the frame or region.
         """
-        # Convert the frame to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
         # If no ROI specified, calculate brightness of entire frame (backward compatibility)
         if roi_points is None:
-            return cv2.mean(gray)[0]
-        
-        # Create mask for the region of interest
-        mask = np.zeros(gray.shape[:2], dtype=np.uint8)
-        
-        # Convert points to proper format for fillPoly
-        if len(roi_points.shape) == 3:
-            # Already in (N, 1, 2) format
-            roi_points_int = roi_points.astype(np.int32)
-        else:
-            # Convert (N, 2) to (N, 1, 2) format
-            roi_points_int = roi_points.astype(np.int32).reshape((-1, 1, 2))
-        
-        # Fill the polygon area in the mask
-        cv2.fillPoly(mask, [roi_points_int], 255)
-        
+            return _luma(cv2.mean(frame))
+
+        geometry = self._roi_geometry(roi_points, frame.shape)
+        if geometry is None:
+            return 0.0  # ROI lies entirely outside the frame
+        x0, y0, x1, y1, mask = geometry
+
         # Calculate mean brightness only within the masked region
-        region_brightness = cv2.mean(gray, mask=mask)[0]
+        region_brightness = _luma(cv2.mean(frame[y0:y1, x0:x1], mask=mask))
         # print(f"[BrightnessController] Calculated region brightness: {region_brightness}")
         return region_brightness
 
+    def _roi_geometry(self, roi_points, frame_shape):
+        """
+        Return (x0, y0, x1, y1, mask) for the ROI clipped to the frame, or None if empty.
+
+        The result is cached by point values and frame size, since the region
+        is static for a session while callers rebuild the array every frame.
+        mask is None when the polygon fills its bounding box.
+        """
+        key = (roi_points.tobytes(), roi_points.dtype.str, frame_shape[:2])
+        if key == self._roi_key:
+            return self._roi_cached
+
+        # Convert points to the (N, 1, 2) int32 format fillPoly expects,
+        # without a copy when the caller already passes that layout
+        if roi_points.dtype == np.int32 and roi_points.ndim == 3:
+            roi_points_int = roi_points
+        else:
+            roi_points_int = roi_points.astype(np.int32).reshape((-1, 1, 2))
+        x, y, w, h = cv2.boundingRect(roi_points_int)
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, frame_shape[1]), min(y + h, frame_shape[0])
+
+        if x1 <= x0 or y1 <= y0:
+            geometry = None
+        else:
+            mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+            cv2.fillPoly(mask, [roi_points_int - np.array([x0, y0], dtype=np.int32)], 255)
+            if cv2.countNonZero(mask) == mask.size:
+                mask = None  # rectangular region: the crop alone is the ROI
+            geometry = (x0, y0, x1, y1, mask)
+
+        self._roi_key = key
+        self._roi_cached = geometry
+        return geometry
+
     def compute_with_antiwindup(self, currentValue):
         """
         Compute PID output with anti-windup (back-calculation method).
@@ -71,49 +137,95 @@ class BrightnessController(PIDController):
         Returns:
             float: The clamped output of the PID controller.
         """
-        # Calculate the error
-        error = self.target - currentValue
-
-        # Calculate the proportional term
-        p_term = self.Kp * error
-
-        # Calculate the derivative term
-        derivative = error - self.previousError
-        d_term = self.Kd * derivative
-
-        # Calculate the integral term
-        i_term = self.Ki * self.integral
-
-        # Compute unclamped output
-        output = p_term + i_term + d_term
-
-        # Clamp the output
-        clamped_output = np.clip(output, self.output_min, self.output_max)
-
-        # Anti-windup: only integrate if not saturated
-        # or if integration would reduce the error
-        if (output == clamped_output) or (np.sign(error) != np.sign(self.integral)):
-            self.integral += error
-        # else: don't integrate when saturated to prevent windup
-
-        # Update the previous error
-        self.previousError = error
+        output, self.integral, self.previousError = _pid_step(
+            self.target - currentValue, self.previousError, self.integral,
+            self.Kp, self.Ki, self.Kd, self.output_min, self.output_max)
+        return output
 
-        return clamped_output
-
-    def adjustBrightness(self, frame, adjustment):
+    def adjustBrightness(self, frame, adjustment, reuse_buffer=False):
         """
         Adjust the brightness of a frame, optionally within a specific region of interest.
 
         Args:
             frame (np.array): The frame to adjust the brightness of.
             adjustment (float): The amount to adjust the brightness by.
+            reuse_buffer (bool): Write into a buffer owned by the controller
+                instead of allocating a new frame. The returned array is then
+                overwritten by the next call, so only pass True for a scratch
+                frame that is used and dropped before calling again. Ignored
+                when use_opencl is set (the result is downloaded into a new array).
 
         Returns:
             np.array: The frame with adjusted brightness.
         """
         # Clip the adjustment to full pixel value range
-        adjustment = np.clip(adjustment, -255, 255)
+        adjustment = max(-255.0, min(255.0, float(adjustment)))
 
         # print(f"[BrightnessController] Applying global brightness adjustment: {adjustment}")
-        return cv2.convertScaleAbs(frame, alpha=1, beta=adjustment)
+        if self.use_opencl:
+            return cv2.convertScaleAbs(cv2.UMat(frame), alpha=1, beta=adjustment).get()
+        if not reuse_buffer:
+            return cv2.convertScaleAbs(frame, alpha=1, beta=adjustment)
+        dst = self._scale_dst
+        if dst is None or dst.shape != frame.shape:
+            dst = self._scale_dst = np.empty(frame.shape, dtype=np.uint8)
+        return cv2.convertScaleAbs(frame, dst=dst, alpha=1, beta=adjustment)
+
+
+class BrightnessControllerBatch:
+    """
+    N independent anti-windup PID controllers (e.g. one per brightness region)
+    stepped together.
+
+    State is kept as a struct of arrays: ``state[:, 0]`` error,
+    ``state[:, 1]`` integral, ``state[:, 2]`` previous error, one row per
+    controller, and ``gains[:, 0:3]`` holds Kp/Ki/Kd. step() applies the same
+    law as BrightnessController.compute_with_antiwindup to every row in one
+    vectorized call.
+
+    Attributes:
+        state (np.ndarray): (N, 3) controller state.
+        gains (np.ndarray): (N, 3) Kp, Ki, Kd per controller.
+        target (np.ndarray): (N,) set points.
+    """
+
+    def __init__(self, n, Kp, Ki, Kd, setPoint, output_min=-255, output_max=255):
+        """Kp/Ki/Kd/setPoint may be scalars (shared) or length-n sequences."""
+        self.state = np.zeros((n, 3), dtype=np.float64)
+        self.gains = np.empty((n, 3), dtype=np.float64)
+        self.gains[:, 0] = Kp
+        self.gains[:, 1] = Ki
+        self.gains[:, 2] = Kd
+        self.target = np.broadcast_to(np.asarray(setPoint, dtype=np.float64), (n,)).copy()
+        self.output_min = output_min
+        self.output_max = output_max
+
+    def reset(self):
+        """Clear accumulated error history for every controller."""
+        self.state.fill(0.0)
+
+    def step(self, current_values):
+        """
+        Compute the clamped output of every controller.
+
+        Args:
+            current_values (array-like): (N,) measured values, one per controller.
+
+        Returns:
+            np.ndarray: (N,) clamped outputs.
+        """
+        error = self.target - np.asarray(current_values, dtype=np.float64)
+        integral = self.state[:, 1]
+        kp, ki, kd = self.gains.T
+
+        output = kp * error + ki * integral + kd * (error - self.state[:, 2])
+        clamped = np.clip(output, self.output_min, self.output_max)
+
+        # Anti-windup per controller: integrate unless saturated and the
+        # integral already pushes in the same direction as the error
+        integrate = (clamped == output) | (np.sign(error) != np.sign(integral))
+        integral += np.where(integrate, error, 0.0)
+
+        self.state[:, 0] = error
+        self.state[:, 2] = error
+        return clamped
@@ -0,0 +1,70 @@
+"""
+* File: test_BrightnessController.py
+* Author: IlV
+* Comments:
+* Revision history:
+* Date       Author      Description
+* -----------------------------------------------------------------
+** 161026     IlV         Initial release
+* -----------------------------------------------------------------
+*
+"""
+
+import unittest
+
+from PLVision.PID.BrightnessController import BrightnessController
+
+
+class TestBrightnessController(unittest.TestCase):
+    def assertState(self, controller, integral, previousError):
+        self.assertAlmostEqual(controller.integral, integral)
+        self.assertAlmostEqual(controller.previousError, previousError)
+
+    def test_zero_error(self):
+        controller = BrightnessController(Kp=1.0, Ki=0.5, Kd=0.2, setPoint=100)
+        for _ in range(3):
+            self.assertEqual(controller.compute_with_antiwindup(100), 0)
+            self.assertState(controller, 0, 0)
+
+    def test_unsaturated_ticks(self):
+        controller = BrightnessController(Kp=0.5, Ki=0.1, Kd=0.2, setPoint=100)
+        # error 10: 0.5*10 + 0.1*0 + 0.2*(10 - 0)
+        self.assertAlmostEqual(controller.compute_with_antiwindup(90), 7.0)
+        self.assertState(controller, 10, 10)
+        # error 5: 0.5*5 + 0.1*10 + 0.2*(5 - 10)
+        self.assertAlmostEqual(controller.compute_with_antiwindup(95), 2.5)
+        self.assertState(controller, 15, 5)
+        # error 0: 0.1*15 + 0.2*(0 - 5)
+        self.assertAlmostEqual(controller.compute_with_antiwindup(100), 0.5)
+        self.assertState(controller, 15, 0)
+
+    def test_saturation_at_upper_bound(self):
+        controller = BrightnessController(Kp=10.0, Ki=1.0, Kd=0.0, setPoint=255)
+        # First tick integrates: the empty integral has no sign to agree with
+        self.assertEqual(controller.compute_with_antiwindup(0), controller.output_max)
+        self.assertState(controller, 255, 255)
+        # Saturated with error and integral agreeing: the integral holds
+        for _ in range(3):
+            self.assertEqual(controller.compute_with_antiwindup(0), controller.output_max)
+            self.assertState(controller, 255, 255)
+
+    def test_saturation_at_lower_bound(self):
+        controller = BrightnessController(Kp=10.0, Ki=1.0, Kd=0.0, setPoint=0)
+        self.assertEqual(controller.compute_with_antiwindup(255), controller.output_min)
+        self.assertState(controller, -255, -255)
+        for _ in range(3):
+            self.assertEqual(controller.compute_with_antiwindup(255), controller.output_min)
+            self.assertState(controller, -255, -255)
+
+    def test_saturated_integrates_when_error_opposes_integral(self):
+        controller = BrightnessController(Kp=10.0, Ki=1.0, Kd=0.0, setPoint=0)
+        controller.integral = 1000
+        # -100 + 1000 saturates high, but the negative error unwinds the integral
+        self.assertEqual(controller.compute_with_antiwindup(10), controller.output_max)
+        self.assertState(controller, 990, -10)
+        self.assertEqual(controller.compute_with_antiwindup(10), controller.output_max)
+        self.assertState(controller, 980, -10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,15 +1,23 @@
 import cv2
+import numpy as np
 import threading
 import json
+from functools import partial
+from types import MappingProxyType
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from queue import Queue
+from collections import deque
+from queue import Empty, SimpleQueue
+
+try:
+    import orjson
+except ImportError:  # optional — fall back to the stdlib codec
+    orjson = None
 
 from external_dependencies.MessageBroker import MessageBroker
 from src.VisionSystem.VisionSystem import VisionSystem
 
 from typing import Tuple, Any
-from copy import deepcopy
 
 from src.VisionSystem.core.settings.CameraSettings import CameraSettings
 from src.VisionSystem.core.service.interfaces.i_service import IService
@@ -24,20 +32,26 @@ class FakeSettingsService(IService):
     In-memory fake settings service for testing.
     Does NOT read/write files.
     """
+    __slots__ = ("_settings", "fail_on_update", "fail_on_load")
 
     @property
     def isCalibrated(self) -> bool:
         return False
 
-    def __init__(self, initial_data: CameraSettings | None = None,
+    def __init__(self, initial_data: CameraSettings | dict | None = None,
                  fail_on_update: bool = False,
                  fail_on_load: bool = False):
         """
-        :param initial_data: initial settings dictionary
+        :param initial_data: initial CameraSettings, or a settings dictionary to build one from
         :param fail_on_update: simulate update failure
         :param fail_on_load: simulate load failure
         """
-        self._settings = initial_data or {}
+        # Always hold a CameraSettings, as the real service does, so loadSettings
+        # returns the type VisionSystem expects and updates never need a type check
+        if isinstance(initial_data, CameraSettings):
+            self._settings = initial_data
+        else:
+            self._settings = CameraSettings(initial_data)
         self.fail_on_update = fail_on_update
         self.fail_on_load = fail_on_load
 
@@ -47,7 +61,7 @@ class FakeSettingsService(IService):
         if self.fail_on_load:
             raise RuntimeError("Simulated load failure")
 
-        return deepcopy(self._settings)
+        return self._settings.copy()
 
     # -----------------------------------------------------
 
@@ -63,10 +77,11 @@ class FakeSettingsService(IService):
             return False, "FakeSettingsService: simulated update failure"
 
         try:
-            self._settings.update(settings)
             success, message = camera_settings.updateSettings(settings)
             if not success:
                 return False, message
+            if camera_settings is not self._settings:
+                self._settings = camera_settings.copy()  # keep the in-memory copy in sync
 
             return True, "Fake settings updated (in-memory)"
 
@@ -118,13 +133,103 @@ class FakeSettingsService(IService):
     # -----------------------------------------------------
 
     # Optional helper for tests
-    def get_internal_settings(self) -> dict:
-        return deepcopy(self._settings)
+    def get_internal_settings(self) -> CameraSettings:
+        return self._settings.copy()
+
+
+_MAX_FLUSH_BATCH = 512  # log lines written per idle callback
+_LOG_POLL_MS = 50       # how often the main thread drains the log queue when it is idle
+_MAX_LOG_LINES = 5000   # lines kept in the log widget
+_FRAME_INTERVAL_MS = 33  # preview refresh period (~30 fps)
+_COALESCE_INTERVAL_MS = 100  # at most one log line per coalesced topic per tick
+
+# Published every frame; only the newest message of each is worth a log line
+_COALESCED_TOPICS = frozenset((
+    VisionTopics.FPS,
+    VisionTopics.LATEST_IMAGE,
+    VisionTopics.THRESHOLD_IMAGE,
+))
+
+# isinstance() targets, so subclasses (np.float64, IntEnum / str enums, OrderedDict, ...) still count
+_JSON_TYPES = (dict, list, tuple, str, int, float, bool, type(None))
+
+
+def _describe(obj) -> str:
+    """Short text for objects json cannot encode (arrays, bytes, anything else)"""
+    if isinstance(obj, np.ndarray):
+        return f"ndarray shape={obj.shape} dtype={obj.dtype}"
+    if isinstance(obj, bytes):
+        return f"bytes (length={len(obj)})"
+    return f"{type(obj).__name__} object"
+
+
+def _json_default(obj):
+    """json.dumps fallback: summarise arrays nested in payloads, str() anything else"""
+    if isinstance(obj, np.ndarray):
+        return _describe(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()  # numpy scalar -> plain Python number / bool
+    return str(obj)
+
+
+def _parse_payload(text: str):
+    """Decode a JSON payload typed into the publish editor (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _format_message(msg) -> str:
+    """One-line log text for a received message"""
+    if not isinstance(msg, _JSON_TYPES):
+        return _describe(msg)
+    try:
+        if orjson is not None:
+            return orjson.dumps(msg, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(msg, default=_json_default)
+    except (TypeError, ValueError):
+        return _describe(msg)
 
 
 class TopicBrokerGUI:
     """Simple GUI for publishing and subscribing to topics via MessageBroker"""
 
+    # Topics and sample payloads are fixed, so they are shared by every instance and read-only
+    _TOPICS = (
+        VisionTopics.SERVICE_STATE,
+        VisionTopics.LATEST_IMAGE,
+        VisionTopics.FPS,
+        VisionTopics.CALIBRATION_IMAGE_CAPTURED,
+        VisionTopics.BRIGHTNESS_REGION,
+        VisionTopics.THRESHOLD_REGION,
+        VisionTopics.CALIBRATION_FEEDBACK,
+        VisionTopics.THRESHOLD_IMAGE,
+        VisionTopics.AUTO_BRIGHTNESS,
+        VisionTopics.AUTO_BRIGHTNESS_START,
+        VisionTopics.AUTO_BRIGHTNESS_STOP,
+        VisionTopics.TRANSFORM_TO_CAMERA_POINT,
+    )
+
+    _SAMPLE_PAYLOADS = MappingProxyType({
+        VisionTopics.SERVICE_STATE: {"id": "test-vision", "state": ServiceState.STARTED.value},
+        VisionTopics.LATEST_IMAGE: {"timestamp": "2026-02-24T10:00:00"},
+        VisionTopics.FPS: {"fps": 30.5},
+        VisionTopics.CALIBRATION_IMAGE_CAPTURED: {"image_id": 1},
+        VisionTopics.BRIGHTNESS_REGION: {"region": [0, 0, 100, 100]},
+        VisionTopics.THRESHOLD_REGION: {"threshold": 127},
+        VisionTopics.CALIBRATION_FEEDBACK: {"status": "success"},
+        VisionTopics.THRESHOLD_IMAGE: {"image_id": 2},
+        VisionTopics.AUTO_BRIGHTNESS: {"enabled": True, "value": 128},
+        VisionTopics.AUTO_BRIGHTNESS_START: {"started": True},
+        VisionTopics.AUTO_BRIGHTNESS_STOP: {"stopped": True},
+        VisionTopics.TRANSFORM_TO_CAMERA_POINT: {"x": 10.5, "y": 20.3, "z": 5.1},
+    })
+
+    # Encoded for the payload editor once per process
+    _DEFAULT_PAYLOAD_JSON = MappingProxyType(
+        {t: json.dumps(p, indent=2) for t, p in _SAMPLE_PAYLOADS.items()}
+    )
+
     def __init__(self, root: tk.Tk, broker: MessageBroker):
         self.root = root
         self.broker = broker
@@ -132,46 +237,30 @@ class TopicBrokerGUI:
         self.root.geometry("900x700")
 
         self.subscriptions = {}
-        self.message_queue = Queue()  # Thread-safe queue for log messages
+        self.message_queue = SimpleQueue()  # Thread-safe queue for log messages
+        self._enqueue_log = self.message_queue.put  # bound once; _log_message runs per received message
+        self.root.after(_LOG_POLL_MS, self._flush_log)  # main-thread drain loop for message_queue
+        # Received messages awaiting JSON formatting; bounded so a flood drops the oldest
+        self._received = deque(maxlen=4096)
+        self._received_cond = threading.Condition()
+        threading.Thread(target=self._format_received_loop, name="BrokerLogFormatter", daemon=True).start()
+        # Newest (is_json, msg) per _COALESCED_TOPICS topic, logged once per _COALESCE_INTERVAL_MS
+        self._coalesced = {}
+        self._coalesce_lock = threading.Lock()
+        self.root.after(_COALESCE_INTERVAL_MS, self._emit_coalesced)
         self.state_heartbeat_enabled = True  # Enable periodic state polling
-
-        # Topics
-        self.topics = [
-            VisionTopics.SERVICE_STATE,
-            VisionTopics.LATEST_IMAGE,
-            VisionTopics.FPS,
-            VisionTopics.CALIBRATION_IMAGE_CAPTURED,
-            VisionTopics.BRIGHTNESS_REGION,
-            VisionTopics.THRESHOLD_REGION,
-            VisionTopics.CALIBRATION_FEEDBACK,
-            VisionTopics.THRESHOLD_IMAGE,
-            VisionTopics.AUTO_BRIGHTNESS,
-            VisionTopics.AUTO_BRIGHTNESS_START,
-            VisionTopics.AUTO_BRIGHTNESS_STOP,
-            VisionTopics.TRANSFORM_TO_CAMERA_POINT,
-        ]
-
-        self.sample_payloads = {
-            VisionTopics.SERVICE_STATE: {"id": "test-vision", "state": ServiceState.STARTED.value},
-            VisionTopics.LATEST_IMAGE: {"timestamp": "2026-02-24T10:00:00"},
-            VisionTopics.FPS: {"fps": 30.5},
-            VisionTopics.CALIBRATION_IMAGE_CAPTURED: {"image_id": 1},
-            VisionTopics.BRIGHTNESS_REGION: {"region": [0, 0, 100, 100]},
-            VisionTopics.THRESHOLD_REGION: {"threshold": 127},
-            VisionTopics.CALIBRATION_FEEDBACK: {"status": "success"},
-            VisionTopics.THRESHOLD_IMAGE: {"image_id": 2},
-            VisionTopics.AUTO_BRIGHTNESS: {"enabled": True, "value": 128},
-            VisionTopics.AUTO_BRIGHTNESS_START: {"started": True},
-            VisionTopics.AUTO_BRIGHTNESS_STOP: {"stopped": True},
-            VisionTopics.TRANSFORM_TO_CAMERA_POINT: {"x": 10.5, "y": 20.3, "z": 5.1},
-        }
+        self._hb_after_id = None  # pending heartbeat after() id, cancelled on toggle
 
         self._create_widgets()
-        self._start_queue_polling()
         self._start_state_heartbeat()  # Start periodic state polling
         # Auto-subscribe to all topics to capture vision system messages
         self.root.after(500, self._auto_subscribe_all)
 
+        # Latest-wins mailbox for preview frames posted from the vision thread
+        self._latest_frame = None
+        self._frame_lock = threading.Lock()
+        self.root.after(_FRAME_INTERVAL_MS, self._show_frame)
+
     def _create_widgets(self):
         """Create GUI widgets"""
         # Main container
@@ -187,11 +276,9 @@ class TopicBrokerGUI:
 
         # Topic selection
         ttk.Label(publish_frame, text="Topic:").grid(row=0, column=0, sticky="w", padx=5)
-        self.topic_var = tk.StringVar(value=self.topics[0])
-        topic_combo = ttk.Combobox(publish_frame, textvariable=self.topic_var,
-                                   values=self.topics, state="readonly", width=50)
-        topic_combo.grid(row=0, column=1, sticky="ew", padx=5)
-        topic_combo.bind("<<ComboboxSelected>>", self._on_topic_selected)
+        self.topic_var = tk.StringVar(value=self._TOPICS[0])
+        topic_menu = self._make_topic_menu(publish_frame, self.topic_var, command=self._on_topic_selected)
+        topic_menu.grid(row=0, column=1, sticky="ew", padx=5)
 
         # Payload
         ttk.Label(publish_frame, text="Payload (JSON):").grid(row=1, column=0, sticky="nw", padx=5, pady=5)
@@ -212,10 +299,9 @@ class TopicBrokerGUI:
 
         # Topic selection
         ttk.Label(subscribe_frame, text="Topic:").grid(row=0, column=0, sticky="w", padx=5)
-        self.subscribe_topic_var = tk.StringVar(value=self.topics[0])
-        subscribe_combo = ttk.Combobox(subscribe_frame, textvariable=self.subscribe_topic_var,
-                                       values=self.topics, state="readonly", width=50)
-        subscribe_combo.grid(row=0, column=1, sticky="ew", padx=5)
+        self.subscribe_topic_var = tk.StringVar(value=self._TOPICS[0])
+        subscribe_menu = self._make_topic_menu(subscribe_frame, self.subscribe_topic_var)
+        subscribe_menu.grid(row=0, column=1, sticky="ew", padx=5)
 
         # Subscribe button
         button_frame2 = ttk.Frame(subscribe_frame)
@@ -228,6 +314,7 @@ class TopicBrokerGUI:
         # Active subscriptions
         ttk.Label(subscribe_frame, text="Active Subscriptions:").grid(row=1, column=0, columnspan=3, sticky="w", padx=5, pady=(10, 0))
         self.subscriptions_var = tk.StringVar(value="None")
+        self._subs_label_text = "None"  # last text pushed to subscriptions_var
         subscriptions_label = ttk.Label(subscribe_frame, textvariable=self.subscriptions_var,
                                         foreground="blue", wraplength=600, justify="left")
         subscriptions_label.grid(row=2, column=0, columnspan=3, sticky="ew", padx=5)
@@ -258,6 +345,15 @@ class TopicBrokerGUI:
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(3, weight=1)
 
+    def _make_topic_menu(self, parent, variable: tk.StringVar, command=None) -> ttk.Menubutton:
+        """Topic picker: a Menubutton with a prebuilt radio menu (lighter than a readonly Combobox)"""
+        button = ttk.Menubutton(parent, textvariable=variable, width=50)
+        menu = tk.Menu(button, tearoff=0)
+        for topic in self._TOPICS:
+            menu.add_radiobutton(label=topic, variable=variable, value=topic, command=command)
+        button["menu"] = menu
+        return button
+
     def _on_topic_selected(self, event=None):
         """Update payload when topic is selected"""
         self._update_payload_text()
@@ -265,9 +361,8 @@ class TopicBrokerGUI:
     def _update_payload_text(self):
         """Update the payload text field with default payload"""
         topic = self.topic_var.get()
-        payload = self.sample_payloads.get(topic, {})
         self.payload_text.delete("1.0", tk.END)
-        self.payload_text.insert("1.0", json.dumps(payload, indent=2))
+        self.payload_text.insert("1.0", self._DEFAULT_PAYLOAD_JSON.get(topic, "{}"))
 
     def _load_default_payload(self):
         """Load default payload for selected topic"""
@@ -279,17 +374,17 @@ class TopicBrokerGUI:
         payload_str = self.payload_text.get("1.0", tk.END).strip()
 
         try:
-            payload = json.loads(payload_str) if payload_str else {}
-        except json.JSONDecodeError as e:
+            payload = _parse_payload(payload_str) if payload_str else {}
+        except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
             messagebox.showerror("Invalid JSON", f"Error parsing payload: {e}")
             return
 
         try:
             self.broker.publish(topic, payload)
-            self._log_message(f"✓ Published to '{topic}'", "success")
+            self._log_message(f"✓ Published to '{topic}'")
         except Exception as e:
             messagebox.showerror("Publish Error", str(e))
-            self._log_message(f"✗ Publish failed: {e}", "error")
+            self._log_message(f"✗ Publish failed: {e}")
 
     def _subscribe_topic(self):
         """Subscribe to selected topic"""
@@ -299,59 +394,40 @@ class TopicBrokerGUI:
             messagebox.showwarning("Already Subscribed", f"Already subscribed to '{topic}'")
             return
 
-        def callback(msg):
-            # Handle non-JSON-serializable objects (like numpy arrays)
-            try:
-                msg_str = json.dumps(msg)
-            except TypeError:
-                # For non-serializable objects, show type and basic info
-                if hasattr(msg, 'shape'):  # numpy array
-                    msg_str = f"ndarray shape={msg.shape} dtype={msg.dtype}"
-                elif isinstance(msg, bytes):
-                    msg_str = f"bytes (length={len(msg)})"
-                else:
-                    msg_str = f"{type(msg).__name__} object"
-
-            self._log_message(f"[{topic}] {msg_str}", "received")
+        callback = self._make_callback(topic)
 
         try:
             self.broker.subscribe(topic, callback)
             self.subscriptions[topic] = callback
             self._update_subscriptions_label()
-            self._log_message(f"✓ Subscribed to '{topic}'", "success")
+            self._log_message(f"✓ Subscribed to '{topic}'")
         except Exception as e:
             messagebox.showerror("Subscribe Error", str(e))
-            self._log_message(f"✗ Subscribe failed: {e}", "error")
+            self._log_message(f"✗ Subscribe failed: {e}")
 
     def _auto_subscribe_all(self):
         """Auto-subscribe to all VisionTopics"""
-        subscribed_count = 0
-        for topic in self.topics:
-            if topic not in self.subscriptions:
-                def callback(msg, t=topic):
-                    # Handle non-JSON-serializable objects (like numpy arrays)
-                    try:
-                        msg_str = json.dumps(msg)
-                    except TypeError:
-                        # For non-serializable objects, show type and basic info
-                        if hasattr(msg, 'shape'):  # numpy array
-                            msg_str = f"ndarray shape={msg.shape} dtype={msg.dtype}"
-                        elif isinstance(msg, bytes):
-                            msg_str = f"bytes (length={len(msg)})"
-                        else:
-                            msg_str = f"{type(msg).__name__} object"
-
-                    self._log_message(f"[{t}] {msg_str}", "received")
-
-                try:
-                    self.broker.subscribe(topic, callback)
-                    self.subscriptions[topic] = callback
-                    subscribed_count += 1
-                except Exception as e:
-                    self._log_message(f"✗ Failed to subscribe to '{topic}': {e}", "error")
+        # dict.fromkeys drops repeated topic strings (both AUTO_BRIGHTNESS_* share one)
+        pairs = [(topic, self._make_callback(topic))
+                 for topic in dict.fromkeys(self._TOPICS) if topic not in self.subscriptions]
+        subscribed = self._subscribe_many(pairs)
+        self.subscriptions.update(subscribed)
 
         self._update_subscriptions_label()
-        self._log_message(f"✓ Auto-subscribed to {subscribed_count} topics", "success")
+        self._log_message(f"✓ Auto-subscribed to {len(subscribed)} topics")
+
+    def _subscribe_many(self, pairs) -> dict:
+        """Subscribe each (topic, callback) pair in one pass; returns the pairs that succeeded"""
+        subscribe = self.broker.subscribe
+        subscribed = {}
+        for topic, callback in pairs:
+            try:
+                subscribe(topic, callback)
+            except Exception as e:
+                self._log_message(f"✗ Failed to subscribe to '{topic}': {e}")
+            else:
+                subscribed[topic] = callback
+        return subscribed
 
     def _unsubscribe_topic(self):
         """Unsubscribe from selected topic"""
@@ -365,10 +441,10 @@ class TopicBrokerGUI:
             # Remove from tracking
             del self.subscriptions[topic]
             self._update_subscriptions_label()
-            self._log_message(f"✓ Unsubscribed from '{topic}'", "success")
+            self._log_message(f"✓ Unsubscribed from '{topic}'")
         except Exception as e:
             messagebox.showerror("Unsubscribe Error", str(e))
-            self._log_message(f"✗ Unsubscribe failed: {e}", "error")
+            self._log_message(f"✗ Unsubscribe failed: {e}")
 
     def _unsubscribe_all(self):
         """Unsubscribe from all topics"""
@@ -379,37 +455,97 @@ class TopicBrokerGUI:
         unsubscribed_count = len(self.subscriptions)
         self.subscriptions.clear()
         self._update_subscriptions_label()
-        self._log_message(f"✓ Unsubscribed from {unsubscribed_count} topics", "success")
+        self._log_message(f"✓ Unsubscribed from {unsubscribed_count} topics")
 
     def _update_subscriptions_label(self):
-        """Update the active subscriptions label"""
+        """Update the active subscriptions label (only touches Tk when the text changes)"""
         if self.subscriptions:
             subs_text = ", ".join(self.subscriptions.keys())
         else:
             subs_text = "None"
-        self.subscriptions_var.set(subs_text)
-
-    def _log_message(self, message: str, level: str = "info"):
-        """Add message to queue (thread-safe)"""
-        self.message_queue.put(message)
-
-    def _process_message_queue(self):
-        """Process messages from queue and update GUI - runs in main thread"""
-        while not self.message_queue.empty():
+        # StringVar.set fires traces and a relayout even for identical text
+        if subs_text != self._subs_label_text:
+            self._subs_label_text = subs_text
+            self.subscriptions_var.set(subs_text)
+
+    def _make_callback(self, topic: str):
+        """Subscriber callback for topic; kept alive by self.subscriptions (the broker holds a weakref)"""
+        return partial(self._on_received, topic)
+
+    def _on_received(self, topic: str, msg):
+        """Subscriber callback body - runs in the publisher's thread, so keep it O(1)"""
+        if topic in _COALESCED_TOPICS:
+            # Per-frame topics: keep only the newest message, _emit_coalesced logs it
+            is_json = isinstance(msg, _JSON_TYPES)
+            entry = (True, msg) if is_json else (False, _describe(msg))
+            with self._coalesce_lock:
+                self._coalesced[topic] = entry
+            return
+        if not isinstance(msg, _JSON_TYPES):  # arrays, bytes, ...: summarise now, never keep the frame
+            self._log_message(f"[{topic}] {_describe(msg)}")
+            return
+        # JSON encoding happens on the formatter thread, off the publish path
+        with self._received_cond:
+            self._received.append((topic, msg))
+            self._received_cond.notify()
+
+    def _format_received_loop(self):
+        """Formatter thread: turn queued (topic, msg) pairs into log lines in batches"""
+        while True:
+            with self._received_cond:
+                while not self._received:
+                    self._received_cond.wait()
+                batch = list(self._received)
+                self._received.clear()
+            for topic, msg in batch:
+                self._log_message(f"[{topic}] {_format_message(msg)}")
+
+    def _emit_coalesced(self):
+        """Log the newest message of each per-frame topic received since the last tick - runs in main thread"""
+        with self._coalesce_lock:
+            pending, self._coalesced = self._coalesced, {}
+        for topic, (is_json, msg) in pending.items():
+            text = _format_message(msg) if is_json else msg
+            self._log_message(f"[{topic}] {text}")
+        self.root.after(_COALESCE_INTERVAL_MS, self._emit_coalesced)
+
+    def _log_message(self, message: str):
+        """Add message to queue (thread-safe, never touches Tk); _flush_log picks it up"""
+        self._enqueue_log(message)
+
+    def _flush_log(self):
+        """Drain the log queue in bounded batches - the main thread's own poll loop"""
+        # Worker threads only put into message_queue; this loop is the one thing that
+        # reschedules itself, so nothing but the Tk main thread ever calls into Tk
+        messages = []
+        append = messages.append
+        get = self.message_queue.get_nowait
+        for _ in range(_MAX_FLUSH_BATCH):
             try:
-                message = self.message_queue.get_nowait()
-                self.log_text.config(state="normal")
-                self.log_text.insert(tk.END, f"{message}\n")
-                self.log_text.see(tk.END)
-                self.log_text.config(state="disabled")
-            except:
+                append(get())
+            except Empty:
+                # Drained: look again after the poll interval
+                self.root.after(_LOG_POLL_MS, self._flush_log)
                 break
-        # Schedule next poll
-        self.root.after(100, self._process_message_queue)
-
-    def _start_queue_polling(self):
-        """Start the queue polling mechanism"""
-        self.root.after(100, self._process_message_queue)
+        else:
+            # Batch full: come straight back for the rest on the next idle pass
+            self.root.after_idle(self._flush_log)
+        if messages:
+            self._write_log(messages)
+
+    def _write_log(self, messages):
+        """Append messages to the log widget in one insert - runs in main thread"""
+        log = self.log_text
+        config = log.config
+        END = tk.END
+        config(state="normal")
+        log.insert(END, "\n".join(messages) + "\n")
+        # Keep only the newest _MAX_LOG_LINES so the widget doesn't grow without bound
+        lines = int(log.index("end-1c").split(".")[0])
+        if lines > _MAX_LOG_LINES:
+            log.delete("1.0", f"{lines - _MAX_LOG_LINES}.0")
+        log.see(END)
+        config(state="disabled")
 
     def _start_state_heartbeat(self):
         """Start periodic state heartbeat to monitor vision system state"""
@@ -418,22 +554,46 @@ class TopicBrokerGUI:
     def _toggle_state_heartbeat(self):
         """Toggle state heartbeat on/off"""
         self.state_heartbeat_enabled = self.heartbeat_var.get()
+        # Drop any pending tick first, so re-enabling never leaves two timers running
+        if self._hb_after_id is not None:
+            self.root.after_cancel(self._hb_after_id)
+            self._hb_after_id = None
         if self.state_heartbeat_enabled:
-            self._log_message("✓ State heartbeat ENABLED - republishing every 2 seconds", "success")
+            self._log_message("✓ State heartbeat ENABLED - republishing every 2 seconds")
             self._poll_state_heartbeat()
         else:
-            self._log_message("✓ State heartbeat DISABLED", "success")
+            self._log_message("✓ State heartbeat DISABLED")
 
     def _poll_state_heartbeat(self):
         """Periodically republish current state to simulate continuous heartbeat"""
-        if self.state_heartbeat_enabled and VisionTopics.SERVICE_STATE in self.subscriptions:
+        self._hb_after_id = None
+        if not self.state_heartbeat_enabled:
+            return
+        # Only publish while someone (this GUI) is listening
+        if VisionTopics.SERVICE_STATE in self.subscriptions:
             # Republish the default state payload to simulate heartbeat
-            state_payload = self.sample_payloads[VisionTopics.SERVICE_STATE]
+            state_payload = self._SAMPLE_PAYLOADS[VisionTopics.SERVICE_STATE]
             self.broker.publish(VisionTopics.SERVICE_STATE, state_payload)
 
-        if self.state_heartbeat_enabled:
-            # Schedule next heartbeat
-            self.root.after(2000, self._poll_state_heartbeat)
+        # Schedule next heartbeat
+        self._hb_after_id = self.root.after(2000, self._poll_state_heartbeat)
+
+    def post_frame(self, img) -> None:
+        """Hand a preview frame to the main thread (thread-safe); an undisplayed older frame is dropped"""
+        with self._frame_lock:
+            self._latest_frame = img
+
+    def _show_frame(self):
+        """Display the newest posted frame with cv2.imshow - runs in main thread"""
+        with self._frame_lock:
+            img, self._latest_frame = self._latest_frame, None
+        if img is not None:
+            cv2.imshow("Vision System", img)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            print("\nQuitting vision system...")
+            self.root.quit()
+            return
+        self.root.after(_FRAME_INTERVAL_MS, self._show_frame)
 
     def _clear_log(self):
         """Clear the log"""
@@ -447,29 +607,36 @@ if __name__ == "__main__":
 
     root = tk.Tk()
     gui = TopicBrokerGUI(root, broker)
+    stop_vision = threading.Event()
 
-    # Run vision system in a separate thread (background)
+    # Run vision system in a separate thread (background); it only produces frames,
+    # all HighGUI calls (imshow/waitKey) happen on the Tk main thread
     def run_vision_system():
         print("Starting Vision System...")
         vs = VisionSystem(message_broker=broker,
                           service=FakeSettingsService(initial_data=CameraSettings()))
         try:
-            while True:
+            seen = 0
+            while not stop_vision.is_set():
+                # Sleep until the grabber has a new frame instead of polling for one;
+                # the timeout only bounds how long a stop request can go unnoticed
+                count = vs.frame_grabber.wait_for_frame(seen, timeout=0.1)
+                if count == seen:
+                    continue
+                seen = count
                 _, img, _ = vs.run()
                 if img is not None:
-                    cv2.imshow("Vision System", img)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    print("\nQuitting vision system...")
-                    root.quit()
-                    break
+                    gui.post_frame(img)
         except KeyboardInterrupt:
             print("\nInterrupted by user")
             root.quit()
-        finally:
-            cv2.destroyAllWindows()
 
     vision_thread = threading.Thread(target=run_vision_system, daemon=True)
     vision_thread.start()
 
     # Run GUI mainloop in main thread (required by tkinter)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        stop_vision.set()
+        cv2.destroyAllWindows()